@@ -0,0 +1,41 @@
+"""
+Compare two result files of `run_benchmarks.py`, and exit with an error if any benchmark got slower than the given
+threshold.
+"""
+import argparse
+import json
+import sys
+
+KEYS = ('benchmark', 'number_of_sequences', 'length', 'gap_density', 'alphabet')
+
+
+def load(file_name: str) -> dict:
+    with open(file_name) as file:
+        results = json.load(file)['results']
+
+    return {tuple(result.get(key) for key in KEYS): result['seconds'] for result in results}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare two benchmark result files of pyMSA.')
+    parser.add_argument('baseline', help='results of the baseline commit')
+    parser.add_argument('candidate', help='results of the candidate commit')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='maximum ratio candidate/baseline before reporting a regression')
+    args = parser.parse_args()
+
+    baseline, candidate = load(args.baseline), load(args.candidate)
+    regressions = 0
+
+    for key in sorted(baseline.keys() & candidate.keys(), key=str):
+        ratio = candidate[key] / baseline[key] if baseline[key] > 0 else float('inf')
+        flag = ''
+
+        if ratio > args.threshold:
+            regressions += 1
+            flag = '  <-- regression'
+
+        name = ' '.join(str(value) for value in key if value is not None)
+        print('{0:<70} {1:10.6f} s {2:10.6f} s {3:6.2f}x{4}'.format(name, baseline[key], candidate[key], ratio, flag))
+
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,122 @@
+"""
+Benchmark suite of pyMSA.
+
+Times every score (and the parsing of a substitution matrix file) over a grid of reproducible synthetic alignments,
+and writes the results to a JSON file that can be compared between commits with `compare_benchmarks.py`:
+
+    $ python benchmarks/run_benchmarks.py --output before.json
+    $ git checkout other-commit
+    $ python benchmarks/run_benchmarks.py --output after.json
+    $ python benchmarks/compare_benchmarks.py before.json after.json
+"""
+import argparse
+import datetime
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+BASE_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+# time the checked-out sources, even if another version of pyMSA is installed
+sys.path.insert(0, os.path.join(BASE_DIRECTORY, '..'))
+
+from pymsa import MSA, SumOfPairs, WeightedSumOfPairs, AffineSumOfPairs, Star, Entropy, PercentageOfNonGaps, \
+    PercentageOfTotallyConservedColumns, FileMatrix, Blosum62
+from pymsa.util.synthetic import generate_alignment, PROTEIN, DNA
+
+MATRIX_FILE = os.path.join(BASE_DIRECTORY, '..', 'examples', 'PAM380.txt')
+
+SCORES = {
+    'SumOfPairs': lambda msa: SumOfPairs(msa, Blosum62()),
+    'WeightedSumOfPairs': lambda msa: WeightedSumOfPairs(msa, Blosum62()),
+    'AffineSumOfPairs': lambda msa: AffineSumOfPairs(msa, Blosum62()),
+    'Star': lambda msa: Star(msa, Blosum62()),
+    'Entropy': Entropy,
+    'PercentageOfNonGaps': PercentageOfNonGaps,
+    'PercentageOfTotallyConservedColumns': PercentageOfTotallyConservedColumns,
+}
+
+ALPHABETS = {'protein': PROTEIN, 'dna': DNA}
+
+GRIDS = {
+    'quick': {'number_of_sequences': [10, 100], 'length': [100, 1000], 'gap_density': [0.1], 'alphabet': ['protein']},
+    'full': {'number_of_sequences': [10, 100, 1000], 'length': [100, 1000, 10000], 'gap_density': [0.05, 0.3],
+             'alphabet': ['protein', 'dna']},
+}
+
+
+def measure(function, repeat: int) -> float:
+    """
+    :return: Best wall time of `repeat` calls to the function, in seconds.
+    """
+    times = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+def get_commit() -> str:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=BASE_DIRECTORY,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(grid: dict, repeat: int) -> list:
+    results = []
+
+    for number_of_sequences, length, gap_density, alphabet in itertools.product(
+            grid['number_of_sequences'], grid['length'], grid['gap_density'], grid['alphabet']):
+        msa = generate_alignment(number_of_sequences, length, gap_density, ALPHABETS[alphabet])
+        parameters = {'number_of_sequences': number_of_sequences, 'length': length, 'gap_density': gap_density,
+                      'alphabet': alphabet}
+
+        for name, score in SCORES.items():
+            # a fresh alignment every time, so cached statistics are not shared between runs
+            seconds = measure(lambda: score(MSA(msa.sequences, msa.ids)).compute(), repeat)
+            results.append(dict(benchmark=name, seconds=seconds, **parameters))
+            print('{0:<40} {1} {2:.6f} s'.format(name, parameters, seconds), flush=True)
+
+    # parsing the file (FileMatrix itself caches parsed files)
+    for name, function in (('FileMatrix', lambda: FileMatrix.read_matrix_from_file(MATRIX_FILE)),
+                           ('FileMatrix (cached)', lambda: FileMatrix(MATRIX_FILE))):
+        seconds = measure(function, repeat)
+        results.append({'benchmark': name, 'seconds': seconds})
+        print('{0:<40} {1:.6f} s'.format(name, seconds), flush=True)
+
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the scores of pyMSA over synthetic alignments.')
+    parser.add_argument('--grid', choices=sorted(GRIDS), default='quick', help='grid of alignment sizes')
+    parser.add_argument('--repeat', type=int, default=3, help='number of runs of every benchmark (best is kept)')
+    parser.add_argument('--output', default='benchmarks.json', help='output JSON file')
+    args = parser.parse_args()
+
+    report = {
+        'metadata': {
+            'commit': get_commit(),
+            'date': datetime.datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'grid': args.grid,
+            'repeat': args.repeat,
+        },
+        'results': run(GRIDS[args.grid], args.repeat),
+    }
+
+    with open(args.output, 'w') as file:
+        json.dump(report, file, indent=2)
@@ -1,4 +1,4 @@
-from pymsa import MSA, Entropy, PercentageOfNonGaps, PercentageOfTotallyConservedColumns, Star, SumOfPairs
+from pymsa import MSA, Evaluator, Entropy, PercentageOfNonGaps, PercentageOfTotallyConservedColumns, Star, SumOfPairs
 from pymsa import PAM250, Blosum62, FileMatrix
 from pymsa.util.fasta import print_alignment
 
@@ -10,36 +10,21 @@ def run_all_scores(sequences: list) -> None:
     msa = MSA(aligned_sequences, sequences_id)
     print_alignment(msa)
 
-    # Percentage of non-gaps and totally conserved columns
-    non_gaps = PercentageOfNonGaps(msa)
-    totally_conserved_columns = PercentageOfTotallyConservedColumns(msa)
+    # All the scores are computed in a single pass over the alignment
+    evaluator = Evaluator([PercentageOfNonGaps, PercentageOfTotallyConservedColumns, Entropy,
+                           (SumOfPairs, Blosum62()), (SumOfPairs, PAM250()), (SumOfPairs, FileMatrix('PAM380.txt')),
+                           (Star, Blosum62()), (Star, PAM250())])
+    non_gaps, conserved, entropy, sop_blosum62, sop_pam250, sop_pam380, star_blosum62, star_pam250 = \
+        evaluator.evaluate(msa)
 
-    percentage = non_gaps.compute()
-    print("Percentage of non-gaps: {0} %".format(percentage))
-
-    conserved = totally_conserved_columns.compute()
+    print("Percentage of non-gaps: {0} %".format(non_gaps))
     print("Percentage of totally conserved columns: {0}".format(conserved))
-
-    # Entropy
-    value = Entropy(msa).compute()
-    print("Entropy score: {0}".format(value))
-
-    # Sum of pairs
-    value = SumOfPairs(msa, Blosum62()).compute()
-    print("Sum of Pairs score (Blosum62): {0}".format(value))
-
-    value = SumOfPairs(msa, PAM250()).compute()
-    print("Sum of Pairs score (PAM250): {0}".format(value))
-
-    value = SumOfPairs(msa, FileMatrix('PAM380.txt')).compute()
-    print("Sum of Pairs score (PAM380): {0}".format(value))
-
-    # Star
-    value = Star(msa, Blosum62()).compute()
-    print("Star score (Blosum62): {0}".format(value))
-
-    value = Star(msa, PAM250()).compute()
-    print("Star score (PAM250): {0}".format(value))
+    print("Entropy score: {0}".format(entropy))
+    print("Sum of Pairs score (Blosum62): {0}".format(sop_blosum62))
+    print("Sum of Pairs score (PAM250): {0}".format(sop_pam250))
+    print("Sum of Pairs score (PAM380): {0}".format(sop_pam380))
+    print("Star score (Blosum62): {0}".format(star_blosum62))
+    print("Star score (PAM250): {0}".format(star_pam250))
 
 
 if __name__ == '__main__':
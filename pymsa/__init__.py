@@ -1,11 +1,26 @@
 from .core.msa import MSA
-from .core.score import SumOfPairs, Star, Entropy, Strike, PercentageOfNonGaps, PercentageOfTotallyConservedColumns
+from .core.score import SumOfPairs, WeightedSumOfPairs, AffineSumOfPairs, Star, Entropy, Strike, PercentageOfNonGaps, \
+    PercentageOfTotallyConservedColumns
 from .core.substitution_matrix import SubstitutionMatrix, FileMatrix, PAM250, Blosum62
-from .util.fasta import read_fasta_file_as_list_of_pairs, print_alignment
+from .core.population import score_population
+from .core.incremental import IncrementalScore
+from .core.evaluator import Evaluator
+from .core.parallel import compute_in_parallel
+from .core.blocks import ColumnBlocks
+from .core.instrumentation import instrument, ScoreMetrics
+from .core.profile import ScoreProfile
+from .util.fasta import iter_fasta_file, read_fasta_file_as_list_of_pairs, read_fasta_file_as_msa, \
+    read_a2m_file_as_msa, print_alignment
+from .util.stockholm import read_stockholm_file_as_msa
+from .util.clustal import read_clustal_file_as_msa
 
 __all__ = [
     'MSA',
-    'SumOfPairs', 'Star', 'Strike', 'Entropy', 'PercentageOfNonGaps', 'PercentageOfTotallyConservedColumns',
+    'SumOfPairs', 'WeightedSumOfPairs', 'AffineSumOfPairs', 'Star', 'Strike', 'Entropy', 'PercentageOfNonGaps',
+    'PercentageOfTotallyConservedColumns',
     'SubstitutionMatrix', 'FileMatrix', 'PAM250', 'Blosum62',
-    'read_fasta_file_as_list_of_pairs', 'print_alignment',
+    'score_population', 'IncrementalScore', 'Evaluator', 'compute_in_parallel', 'ColumnBlocks',
+    'instrument', 'ScoreMetrics', 'ScoreProfile',
+    'iter_fasta_file', 'read_fasta_file_as_list_of_pairs', 'read_fasta_file_as_msa', 'read_a2m_file_as_msa',
+    'read_stockholm_file_as_msa', 'read_clustal_file_as_msa', 'print_alignment',
 ]
@@ -0,0 +1,5 @@
+import sys
+
+from pymsa.cli import main
+
+sys.exit(main())
@@ -0,0 +1,251 @@
+"""
+Command-line batch scorer: score alignment files, directories or glob patterns, streaming one line of results per
+file as CSV or JSON lines, e.g.:
+
+    $ pymsa alignments/*.fasta --score SumOfPairs Entropy --matrix Blosum62 PAM380.txt --jobs 8
+"""
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+from typing import Iterator, List
+
+from pymsa.core.evaluator import Evaluator
+from pymsa.core.msa import MSA
+from pymsa.core.score import SumOfPairs, WeightedSumOfPairs, AffineSumOfPairs, Star, Entropy, PercentageOfNonGaps, \
+    PercentageOfTotallyConservedColumns
+from pymsa.core.substitution_matrix import SubstitutionMatrix, FileMatrix, PAM250, Blosum62
+from pymsa.util.clustal import read_clustal_file_as_msa
+from pymsa.util.fasta import read_fasta_file_as_msa, read_a2m_file_as_msa
+from pymsa.util.stockholm import read_stockholm_file_as_msa
+
+SCORES = {score.__name__: score for score in (
+    SumOfPairs, WeightedSumOfPairs, AffineSumOfPairs, Star, Entropy, PercentageOfNonGaps,
+    PercentageOfTotallyConservedColumns)}
+
+# scores taking a substitution matrix as their first argument
+MATRIX_SCORES = (SumOfPairs, WeightedSumOfPairs, AffineSumOfPairs, Star)
+
+MATRICES = {'PAM250': PAM250, 'Blosum62': Blosum62}
+
+READERS = {
+    'fasta': read_fasta_file_as_msa,
+    'a2m': read_a2m_file_as_msa,
+    'stockholm': read_stockholm_file_as_msa,
+    'clustal': read_clustal_file_as_msa,
+}
+
+_WORKER = {}
+
+
+def get_matrix(name: str) -> SubstitutionMatrix:
+    """
+    :param name: Name of a built-in matrix (case insensitive) or path of a matrix file.
+    :return: Substitution matrix.
+    """
+    for matrix_name, matrix in MATRICES.items():
+        if name.lower() == matrix_name.lower():
+            return matrix.shared()
+
+    if not os.path.isfile(name):
+        raise Exception('Unknown substitution matrix {0} (use {1} or the path of a matrix file)'
+                        .format(name, ', '.join(MATRICES)))
+
+    return FileMatrix(name)
+
+
+def get_objectives(score_names: List[str], matrix_names: List[str]) -> tuple:
+    """
+    :return: Pair (objectives for :class:`Evaluator`, names of the objectives). Scores using a substitution matrix
+        are evaluated with every matrix, and named e.g. `SumOfPairs[Blosum62]`.
+    """
+    scores = {name.lower(): score for name, score in SCORES.items()}
+    matrices = [(os.path.basename(name), get_matrix(name)) for name in matrix_names]
+    objectives, names = [], []
+
+    for score_name in score_names:
+        if score_name.lower() not in scores:
+            raise Exception('Unknown score {0} (use {1})'.format(score_name, ', '.join(SCORES)))
+
+        score = scores[score_name.lower()]
+
+        if score in MATRIX_SCORES:
+            for matrix_name, matrix in matrices:
+                objectives.append((score, matrix))
+                names.append('{0}[{1}]'.format(score.__name__, matrix_name))
+        else:
+            objectives.append(score)
+            names.append(score.__name__)
+
+    return objectives, names
+
+
+def find_files(paths: List[str]) -> Iterator[str]:
+    """
+    Expand files, directories (all the files within, recursively) and glob patterns into a sorted list of files.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, directory_names, file_names in os.walk(path):
+                directory_names.sort()
+
+                for file_name in sorted(file_names):
+                    if not file_name.startswith('.'):
+                        yield os.path.join(directory, file_name)
+        elif os.path.isfile(path):
+            yield path
+        else:
+            matches = sorted(glob.glob(path, recursive=True))
+
+            if not matches:
+                raise Exception('No alignment found at {}'.format(path))
+
+            yield from find_files(matches)
+
+
+def detect_format(file_name: str) -> str:
+    """
+    Guess the format of an alignment file from its first line (or its extension, for A2M/A3M files).
+    """
+    if os.path.splitext(file_name)[1].lower() in ('.a2m', '.a3m'):
+        return 'a2m'
+
+    with open(file_name, 'rb') as file:
+        for line in file:
+            if line.strip():
+                break
+        else:
+            line = b''
+
+    if line.startswith(b'# STOCKHOLM'):
+        return 'stockholm'
+    if line.startswith((b'CLUSTAL', b'MUSCLE', b'PROBCONS')):
+        return 'clustal'
+
+    return 'fasta'
+
+
+def read_alignment(file_name: str, file_format: str = 'auto', gap_character: str = '-') -> MSA:
+    if file_format == 'auto':
+        file_format = detect_format(file_name)
+
+    return READERS[file_format](file_name, gap_character)
+
+
+def _attach(evaluator: Evaluator, file_format: str, gap_character: str) -> None:
+    _WORKER['evaluator'] = evaluator
+    _WORKER['file_format'] = file_format
+    _WORKER['gap_character'] = gap_character
+
+
+def _score_file(file_name: str) -> dict:
+    result = {'file': file_name}
+
+    try:
+        msa = read_alignment(file_name, _WORKER['file_format'], _WORKER['gap_character'])
+
+        if not msa.is_valid:
+            raise Exception('Alignment is not valid')
+
+        result['sequences'] = msa.number_of_sequences
+        result['length'] = len(msa)
+        result['scores'] = _WORKER['evaluator'].evaluate(msa)
+    except Exception as error:
+        result['error'] = str(error) or type(error).__name__
+
+    return result
+
+
+def score_files(file_names: Iterator[str], objectives: list, jobs: int = 1, file_format: str = 'auto',
+                gap_character: str = '-') -> Iterator[dict]:
+    """
+    Score alignment files, yielding the results of every file (in order) as soon as they are available.
+
+    :param file_names: Alignment files.
+    :param objectives: Objectives, as given to :class:`Evaluator`.
+    :param jobs: Number of worker processes (files are scored in this process if 1).
+    :param file_format: Format of the files ('auto' to detect it from their contents).
+    :param gap_character: Gap character of the alignments.
+    :return: Dictionaries with the file, its number of sequences, length and scores (or the error found).
+    """
+    initargs = (Evaluator(objectives), file_format, gap_character)
+
+    if jobs == 1:
+        _attach(*initargs)
+        yield from map(_score_file, file_names)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(jobs, initializer=_attach, initargs=initargs) as executor:
+            yield from executor.map(_score_file, file_names, chunksize=16)
+
+
+def non_negative_integer(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+
+    if number < 0:
+        raise argparse.ArgumentTypeError('{} is not a non-negative integer'.format(value))
+
+    return number
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='pymsa', description='Score multiple sequence alignments.')
+    parser.add_argument('paths', nargs='+', help='alignment files, directories or glob patterns')
+    parser.add_argument('-s', '--score', nargs='+', default=list(SCORES), metavar='SCORE',
+                        help='scores to compute: {} (all by default)'.format(', '.join(SCORES)))
+    parser.add_argument('-m', '--matrix', nargs='+', default=['PAM250'], metavar='MATRIX',
+                        help='substitution matrices ({} or the path of a matrix file; PAM250 by default)'
+                        .format(', '.join(MATRICES)))
+    parser.add_argument('-f', '--format', choices=['auto'] + sorted(READERS), default='auto', dest='file_format',
+                        help='format of the alignments (detected from their contents by default)')
+    parser.add_argument('-g', '--gap-character', default='-', help='gap character of the alignments')
+    parser.add_argument('-j', '--jobs', type=non_negative_integer, default=1,
+                        help='number of worker processes (0 for all the CPUs)')
+    parser.add_argument('-o', '--output', type=argparse.FileType('w'), default=sys.stdout,
+                        help='output file (standard output by default)')
+    parser.add_argument('--json', action='store_true', help='write JSON lines instead of CSV')
+
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    args = get_parser().parse_args(argv)
+
+    try:
+        objectives, names = get_objectives(args.score, args.matrix)
+        file_names = list(find_files(args.paths))
+    except Exception as error:
+        print('pymsa: error: {}'.format(error), file=sys.stderr)
+        return 2
+
+    output = args.output
+    fields = ['file', 'sequences', 'length'] + names + ['error']
+    writer = None if args.json else csv.DictWriter(output, fields, lineterminator='\n')
+    errors = 0
+
+    if writer:
+        writer.writeheader()
+
+    try:
+        for result in score_files(file_names, objectives, args.jobs or os.cpu_count(), args.file_format,
+                                  args.gap_character):
+            result.update(zip(names, result.pop('scores', [])))
+            errors += 'error' in result
+
+            if writer:
+                writer.writerow(result)
+            else:
+                output.write(json.dumps(result) + '\n')
+            output.flush()
+    except BrokenPipeError:
+        # the reader of the output went away (e.g., `pymsa ... | head`)
+        os.dup2(os.open(os.devnull, os.O_WRONLY), output.fileno())
+        return 1
+
+    return 1 if errors else 0
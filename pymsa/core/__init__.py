@@ -1,7 +1,18 @@
-from .score import Score, SumOfPairs, Star, Entropy, Strike, PercentageOfNonGaps, PercentageOfTotallyConservedColumns
+from .score import Score, SumOfPairs, WeightedSumOfPairs, AffineSumOfPairs, Star, Entropy, Strike, \
+    PercentageOfNonGaps, PercentageOfTotallyConservedColumns
 from .substitution_matrix import SubstitutionMatrix, FileMatrix, PAM250, Blosum62
+from .population import score_population
+from .incremental import IncrementalScore
+from .evaluator import Evaluator
+from .parallel import compute_in_parallel
+from .blocks import ColumnBlocks
+from .instrumentation import instrument, ScoreMetrics
+from .profile import ScoreProfile
 
 __all__ = [
-    'Score', 'SumOfPairs', 'Star', 'Strike', 'Entropy', 'PercentageOfNonGaps', 'PercentageOfTotallyConservedColumns',
-    'SubstitutionMatrix', 'FileMatrix', 'PAM250', 'Blosum62'
+    'Score', 'SumOfPairs', 'WeightedSumOfPairs', 'AffineSumOfPairs', 'Star', 'Strike', 'Entropy', 'PercentageOfNonGaps',
+    'PercentageOfTotallyConservedColumns',
+    'SubstitutionMatrix', 'FileMatrix', 'PAM250', 'Blosum62',
+    'score_population', 'IncrementalScore', 'Evaluator', 'compute_in_parallel', 'ColumnBlocks',
+    'instrument', 'ScoreMetrics', 'ScoreProfile'
 ]
@@ -0,0 +1,100 @@
+from typing import Iterator
+
+import numpy as np
+
+from pymsa.core.msa import MSA
+from pymsa.util.fasta import iter_fasta_file_as_bytes
+
+DEFAULT_BLOCK_SIZE = 4096
+
+
+class ColumnBlocks:
+    """
+    Alignment kept on disk and read in blocks of columns, for alignments that do not fit in memory. Peak memory is
+    bounded by the number of sequences times the size of a block, rather than by the size of the whole alignment.
+
+    The matrix is usually memory-mapped. If a lookup table is given, the matrix holds character codes that are
+    translated to indexes into the alphabet block by block; otherwise, it is already encoded.
+    """
+
+    def __init__(self, matrix: np.ndarray, alphabet: str, ids: list = None, gap_character: str = '-',
+                 block_size: int = DEFAULT_BLOCK_SIZE, lookup_table: np.ndarray = None):
+        self.matrix = matrix
+        self.alphabet = alphabet
+        self.ids = ids
+        self.gap_character = gap_character
+        self.block_size = block_size
+        self.lookup_table = lookup_table
+
+    @classmethod
+    def from_fasta(cls, file_name: str, block_size: int = DEFAULT_BLOCK_SIZE, gap_character: str = '-',
+                   directory: str = None) -> 'ColumnBlocks':
+        """
+        Spool an aligned file in FASTA format, one sequence at a time, into a temporary file that is then
+        memory-mapped.
+
+        :param file_name: FASTA file.
+        :param block_size: Number of columns per block.
+        :param gap_character: Gap character of the alignment.
+        :param directory: Directory of the temporary file (the default temporary directory if not given).
+        :return: Column blocks of the alignment.
+        """
+        import tempfile
+
+        ids = []
+        length = None
+        characters = np.zeros(256, dtype=bool)
+
+        with tempfile.TemporaryFile(dir=directory) as spool:
+            for key, row in iter_fasta_file_as_bytes(file_name):
+                if length is None:
+                    length = len(row)
+                elif len(row) != length:
+                    raise Exception('Sequences have different lengths')
+
+                characters[np.frombuffer(row, dtype=np.uint8)] = True
+                spool.write(row)
+                ids.append(key)
+
+            spool.flush()
+            matrix = np.memmap(spool, dtype=np.uint8, mode='r', shape=(len(ids), length))
+
+        codes = np.flatnonzero(characters)
+        lookup_table = np.zeros(256, dtype=np.uint8)
+        lookup_table[codes] = np.arange(len(codes), dtype=np.uint8)
+
+        return cls(matrix, bytes(codes.astype(np.uint8)).decode('ascii'), ids, gap_character, block_size,
+                   lookup_table)
+
+    @classmethod
+    def from_file(cls, file_name: str, block_size: int = DEFAULT_BLOCK_SIZE) -> 'ColumnBlocks':
+        """
+        Memory-map an alignment saved in the binary format of pyMSA (see :meth:`MSA.save`).
+
+        :param file_name: Alignment file.
+        :param block_size: Number of columns per block.
+        :return: Column blocks of the alignment.
+        """
+        msa = MSA.load(file_name, mmap=True)
+        return cls(msa.encoded, msa.alphabet, msa.ids, msa.gap_character, block_size)
+
+    @property
+    def number_of_sequences(self) -> int:
+        return self.matrix.shape[0]
+
+    def __len__(self) -> int:
+        return self.matrix.shape[1]
+
+    def __iter__(self) -> Iterator[MSA]:
+        """
+        :return: Generator of the blocks of columns, as encoded alignments.
+        """
+        for start in range(0, len(self), self.block_size):
+            block = self.matrix[:, start:start + self.block_size]
+
+            if self.lookup_table is None:
+                block = np.asarray(block)
+            else:
+                block = self.lookup_table[block]
+
+            yield MSA.from_encoded(block, self.alphabet, self.ids, self.gap_character)
@@ -0,0 +1,94 @@
+from typing import Iterable, List
+
+import numpy as np
+
+from pymsa.core.instrumentation import measure
+from pymsa.core.msa import MSA
+from pymsa.core.statistics import ColumnStatistics
+
+
+def get_objective(objective) -> tuple:
+    """
+    Normalize an objective, given either as a score class or as a tuple (score class, *arguments), into a pair
+    (score class, arguments).
+    """
+    if isinstance(objective, tuple):
+        return objective[0], objective[1:]
+
+    return objective, ()
+
+
+class Evaluator:
+    """
+    Evaluate several scores over an alignment in a single pass: the histogram of every column is computed once and
+    fed to every score.
+
+    Objectives are given as score classes, or as tuples (score class, *arguments) where the arguments are those
+    following the alignment in the constructor of the score, e.g., `[Entropy, (SumOfPairs, Blosum62())]`.
+    """
+
+    def __init__(self, objectives: list):
+        self.objectives = [get_objective(objective) for objective in objectives]
+
+    def evaluate(self, msa: MSA) -> list:
+        """
+        :param msa: Alignment to score.
+        :return: Value of every objective.
+        """
+        return [np.asarray(value).item() for value in self.evaluate_statistics(msa.column_statistics, [msa])]
+
+    def evaluate_statistics(self, statistics: ColumnStatistics, alignments: List[MSA]) -> list:
+        """
+        Evaluate every objective from the column statistics of one or more (stacked) alignments.
+
+        :param statistics: Column statistics of the alignments.
+        :param alignments: The alignments themselves, used by scores that can't be computed from the statistics.
+        :return: Value of every objective, as an array with one value per alignment if the statistics are stacked.
+        """
+        final_scores = self.get_final_scores(statistics, alignments)
+
+        return [score.aggregate(final_score, statistics.length, statistics.number_of_sequences)
+                for (score, args), final_score in zip(self.objectives, final_scores)]
+
+    def evaluate_blocks(self, blocks: Iterable[MSA]) -> list:
+        """
+        Evaluate every objective over an alignment given as consecutive blocks of columns (see
+        :class:`ColumnBlocks`), consuming the blocks one at a time.
+
+        :param blocks: Blocks of columns of the alignment.
+        :return: Value of every objective.
+        """
+        if not all(score.is_column_separable() for score, args in self.objectives):
+            raise Exception('Scores that are not column separable can\'t be evaluated over blocks of columns')
+
+        final_scores = [0] * len(self.objectives)
+        length = 0
+        number_of_sequences = 0
+
+        for msa in blocks:
+            for i, final_score in enumerate(self.get_final_scores(msa.column_statistics, [msa])):
+                final_scores[i] += np.asarray(final_score).item()
+
+            length += len(msa)
+            number_of_sequences = msa.number_of_sequences
+
+        return [score.aggregate(final_score, length, number_of_sequences)
+                for (score, args), final_score in zip(self.objectives, final_scores)]
+
+    def get_final_scores(self, statistics: ColumnStatistics, alignments: List[MSA]) -> list:
+        """
+        :return: Sum of the column scores of every objective (i.e., before aggregating them).
+        """
+        final_scores = []
+
+        stacked = statistics.encoded.ndim > 2
+
+        for score, args in self.objectives:
+            with measure(score.__name__, statistics.length * len(alignments)):
+                if score.supports_statistics(stacked):
+                    final_scores.append(score.get_column_scores_from_statistics(statistics, *args).sum(axis=-1))
+                else:
+                    values = [score(msa, *args).get_column_scores().sum().item() for msa in alignments]
+                    final_scores.append(np.array(values) if stacked else values[0])
+
+        return final_scores
@@ -0,0 +1,74 @@
+import copy
+
+import numpy as np
+
+from pymsa.core.msa import MSA
+from pymsa.core.score import Score
+
+
+class IncrementalScore:
+    """
+    Keep the column scores of a score, so it can be updated after local edits of the alignment (such as the
+    mutations of an optimizer moving or inserting a block of gaps) in time proportional to the size of the edit.
+    """
+
+    def __init__(self, score: Score):
+        if not score.is_column_separable():
+            raise Exception('Scores that are not column separable can\'t be updated incrementally')
+
+        self.score = score
+        self.column_scores = score.get_column_scores()
+        self.final_score = self.column_scores.sum().item()
+
+    @property
+    def msa(self) -> MSA:
+        return self.score.msa
+
+    def compute(self) -> float:
+        return self.score.aggregate(self.final_score, len(self.msa), self.msa.number_of_sequences)
+
+    def update(self, msa: MSA, start: int, end: int) -> float:
+        """
+        Update the score after editing the columns [start, end) of the alignment. Columns outside of the range must
+        be left untouched, but the edit can change the length of the alignment (e.g., when inserting a block of
+        gaps); in that case, the edited columns replace the columns [start, end - delta) of the previous alignment,
+        where delta is the change in length.
+
+        :param msa: Edited alignment.
+        :param start: First edited column of `msa`.
+        :param end: Column following the last edited column of `msa`.
+        :return: Updated value of the score.
+        """
+        delta = len(msa) - len(self.msa)
+        assert 0 <= start <= end - delta and end <= len(msa), 'Edited range is not valid'
+
+        column_scores = self.get_column_scores(msa, start, end)
+
+        self.final_score += column_scores.sum().item() - self.column_scores[start:end - delta].sum().item()
+
+        if delta == 0:
+            self.column_scores[start:end] = column_scores
+        else:
+            self.column_scores = np.concatenate(
+                (self.column_scores[:start], column_scores, self.column_scores[end - delta:]))
+
+        self.score.msa = msa
+
+        return self.compute()
+
+    def get_column_scores(self, msa: MSA, start: int, end: int) -> np.ndarray:
+        """
+        :return: Scores of the columns [start, end) of an alignment.
+        """
+        if start == end:
+            return np.zeros(0, dtype=self.column_scores.dtype)
+
+        score = copy.copy(self.score)
+
+        # slice whatever the alignment holds: encoding (or decoding) all of it would cost as much as a full compute
+        if msa._sequences is None:
+            score.msa = MSA.from_encoded(msa.encoded[:, start:end], msa.alphabet, msa.ids, msa.gap_character)
+        else:
+            score.msa = MSA([seq[start:end] for seq in msa.sequences], msa.ids, msa.gap_character)
+
+        return score.get_column_scores()
@@ -0,0 +1,122 @@
+import logging
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+LOGGER = logging.getLogger('pyMSA')
+
+# Metrics of the computations in progress (innermost last); it is only non-empty while instrumentation is enabled,
+# so hot paths can skip recording with a single check
+ACTIVE_METRICS = []
+
+_SINKS = []
+
+
+class ScoreMetrics:
+    """
+    Metrics of a single score computation.
+    """
+
+    def __init__(self, score: str, columns: int):
+        self.score = score
+        self.columns = columns
+        self.wall_time = 0.0
+        self.substitution_lookups = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def as_dict(self) -> dict:
+        return {'score': self.score, 'wall_time': self.wall_time, 'columns': self.columns,
+                'substitution_lookups': self.substitution_lookups, 'cache_hits': self.cache_hits,
+                'cache_misses': self.cache_misses}
+
+    def __repr__(self):
+        return 'ScoreMetrics({})'.format(', '.join('{0}={1!r}'.format(*item) for item in self.as_dict().items()))
+
+
+def log_metrics(metrics: ScoreMetrics) -> None:
+    """
+    Default sink: report the metrics through the `pyMSA` logger.
+    """
+    LOGGER.info('{score}: {wall_time:.6f} s, {columns} columns, {substitution_lookups} substitution lookups, '
+                '{cache_hits} cache hits, {cache_misses} cache misses'.format(**metrics.as_dict()))
+
+
+@contextmanager
+def instrument(sink: Callable[[ScoreMetrics], None] = log_metrics):
+    """
+    Enable the instrumentation of score computations within the block: every call to :meth:`Score.compute` (and
+    every objective evaluated by :class:`Evaluator`) reports a :class:`ScoreMetrics` to the sink, e.g.:
+
+        with instrument(metrics.append):
+            SumOfPairs(msa).compute()
+
+    Instrumentation is disabled by default and costs nothing until enabled.
+
+    :param sink: Callable receiving the metrics of every computation (by default, they are logged).
+    """
+    _SINKS.append(sink)
+
+    try:
+        yield
+    finally:
+        _SINKS.remove(sink)
+
+
+def is_enabled() -> bool:
+    return bool(_SINKS)
+
+
+class _Measurement:
+
+    def __init__(self, score: str, columns: int):
+        self.metrics = ScoreMetrics(score, columns)
+        self.start = None
+
+    def __enter__(self) -> ScoreMetrics:
+        ACTIVE_METRICS.append(self.metrics)
+        self.start = time.perf_counter()
+        return self.metrics
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.metrics.wall_time = time.perf_counter() - self.start
+        ACTIVE_METRICS.remove(self.metrics)
+
+        if exc_type is None:
+            for sink in list(_SINKS):
+                sink(self.metrics)
+
+
+class _NoMeasurement:
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return None
+
+
+_NO_MEASUREMENT = _NoMeasurement()
+
+
+def measure(score: str, columns: int):
+    """
+    :return: Context manager measuring a score computation if instrumentation is enabled (a no-op otherwise).
+    """
+    if not _SINKS:
+        return _NO_MEASUREMENT
+
+    return _Measurement(score, columns)
+
+
+def record_substitution_lookups(count: int) -> None:
+    for metrics in ACTIVE_METRICS:
+        metrics.substitution_lookups += count
+
+
+def record_cache_access(hit: bool) -> None:
+    for metrics in ACTIVE_METRICS:
+        if hit:
+            metrics.cache_hits += 1
+        else:
+            metrics.cache_misses += 1
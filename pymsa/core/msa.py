@@ -1,4 +1,67 @@
-from typing import List
+import json
+import struct
+from typing import List, Tuple
+
+import numpy as np
+
+from pymsa.core.instrumentation import ACTIVE_METRICS, record_cache_access
+from pymsa.core.statistics import ColumnStatistics
+
+
+def encode(raw: np.ndarray) -> Tuple[np.ndarray, str]:
+    """
+    Encode a matrix of ASCII codes as indexes into the (sorted) alphabet of characters it contains.
+
+    :param raw: Matrix of ASCII codes (`uint8`).
+    :return: Pair (encoded matrix, alphabet).
+    """
+    codes = np.flatnonzero(np.bincount(raw.ravel(), minlength=256))
+    lookup_table = np.zeros(256, dtype=np.uint8)
+    lookup_table[codes] = np.arange(len(codes), dtype=np.uint8)
+
+    return lookup_table[raw], bytes(codes.astype(np.uint8)).decode('ascii')
+
+
+def encode_sequences(sequences: List[str]) -> Tuple[np.ndarray, str]:
+    """
+    Encode a list of aligned sequences as a N×L matrix of residues.
+
+    :param sequences: Aligned sequences.
+    :return: Pair (encoded matrix, alphabet).
+    """
+    length = len(sequences[0]) if sequences else 0
+
+    if any(len(seq) != length for seq in sequences):
+        raise Exception('Sequences have different lengths')
+
+    raw = np.frombuffer(''.join(sequences).encode('ascii'), dtype=np.uint8).reshape(len(sequences), length)
+    return encode(raw)
+
+
+def encode_rows(rows: list) -> Tuple[np.ndarray, str]:
+    """
+    Encode a list of aligned sequences given as bytes-like objects.
+
+    :param rows: Aligned sequences.
+    :return: Pair (encoded matrix, alphabet).
+    """
+    length = len(rows[0]) if rows else 0
+
+    if any(len(row) != length for row in rows):
+        raise Exception('Sequences have different lengths')
+
+    raw = np.empty((len(rows), length), dtype=np.uint8)
+    for i, row in enumerate(rows):
+        raw[i] = np.frombuffer(row, dtype=np.uint8)
+
+    return encode(raw)
+
+
+MAGIC_NUMBER = b'PYMSA\x01'
+ALIGNMENT = 64
+
+# number of set bits of every byte
+POPCOUNT = np.array([bin(byte).count('1') for byte in range(256)], dtype=np.uint8)
 
 
 class MSA:
@@ -8,11 +71,82 @@ class MSA:
         self._ids = ids
         self.gap_character = gap_character
 
+        self._encoded = None
+        self._alphabet = None
+        self._column_statistics = None
+        self._gap_mask = None
+
+    @classmethod
+    def from_encoded(cls, encoded: np.ndarray, alphabet: str, ids: list = None, gap_character: str = '-') -> 'MSA':
+        """
+        Build an alignment from an already encoded N×L matrix (see :attr:`encoded`). The sequences are only decoded
+        if they are requested.
+
+        :param encoded: Encoded alignment.
+        :param alphabet: Characters of the alignment; the i-th character is encoded as `i`.
+        :return: Alignment.
+        """
+        msa = cls(None, ids, gap_character)
+        msa._encoded = encoded
+        msa._alphabet = alphabet
+
+        return msa
+
+    def save(self, file_name: str) -> None:
+        """
+        Save the alignment in the binary format of pyMSA: a header holding the ids, the alphabet and the gap
+        character, followed by the encoded matrix (aligned to 64 bytes, so it can be memory-mapped).
+
+        :param file_name: Output file.
+        """
+        encoded = np.ascontiguousarray(self.encoded)
+        header = json.dumps({'shape': encoded.shape, 'alphabet': self.alphabet, 'gap_character': self.gap_character,
+                             'ids': self.ids}).encode('utf-8')
+        offset = len(MAGIC_NUMBER) + 4 + len(header)
+        padding = -offset % ALIGNMENT
+
+        with open(file_name, 'wb') as file:
+            file.write(MAGIC_NUMBER)
+            file.write(struct.pack('<I', len(header) + padding))
+            file.write(header + b' ' * padding)
+            file.write(encoded.data)
+
+    @classmethod
+    def load(cls, file_name: str, mmap: bool = True) -> 'MSA':
+        """
+        Load an alignment saved with :meth:`save`.
+
+        :param file_name: Input file.
+        :param mmap: Whether to memory-map the encoded matrix (read-only, without copying it) or to read it into
+            memory.
+        :return: Alignment.
+        """
+        with open(file_name, 'rb') as file:
+            if file.read(len(MAGIC_NUMBER)) != MAGIC_NUMBER:
+                raise Exception('File {} is not a pyMSA alignment'.format(file_name))
+
+            header_length, = struct.unpack('<I', file.read(4))
+            header = json.loads(file.read(header_length).decode('utf-8'))
+            offset = file.tell()
+
+            shape = tuple(header['shape'])
+
+            if mmap and shape[0] * shape[1] > 0:
+                encoded = np.memmap(file_name, dtype=np.uint8, mode='r', offset=offset, shape=shape)
+            else:
+                encoded = np.fromfile(file, dtype=np.uint8, count=shape[0] * shape[1]).reshape(shape)
+
+        return cls.from_encoded(encoded, header['alphabet'], header['ids'], header['gap_character'])
+
     @property
     def sequences(self) -> List[str]:
         """
         :return: Aligned sequences.
         """
+        if self._sequences is None:
+            characters = np.frombuffer(self._alphabet.encode('ascii'), dtype=np.uint8)
+            self._sequences = [row.tobytes().decode('ascii') for row in characters[self._encoded]]
+
         return self._sequences
 
     @property
@@ -22,19 +156,163 @@ class MSA:
         """
         return self._ids
 
+    @property
+    def encoded(self) -> np.ndarray:
+        """
+        Residues of the alignment as a N×L `uint8` matrix of indexes into :attr:`alphabet`. The matrix is built
+        the first time it is requested and cached afterwards.
+
+        :return: Encoded alignment.
+        """
+        if self._encoded is None:
+            self._encoded, self._alphabet = encode_sequences(self._sequences)
+
+        return self._encoded
+
+    @property
+    def alphabet(self) -> str:
+        """
+        :return: Sorted characters found in the alignment; the i-th character is encoded as `i`.
+        """
+        if self._alphabet is None:
+            self._encoded, self._alphabet = encode_sequences(self._sequences)
+
+        return self._alphabet
+
+    @property
+    def column_statistics(self) -> ColumnStatistics:
+        """
+        :return: Cached per-column statistics of the encoded alignment.
+        """
+        if ACTIVE_METRICS:
+            record_cache_access(self._column_statistics is not None)
+
+        if self._column_statistics is None:
+            self._column_statistics = ColumnStatistics(self.encoded, self.alphabet, self.gap_character)
+
+        return self._column_statistics
+
+    def get_gap_runs(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Runs of consecutive gaps of every sequence. They aren't cached, as they are only needed while computing gap
+        openings.
+
+        :return: Tuple (sequence, start, end) of arrays, where the i-th run covers the columns [start[i], end[i]) of
+            sequence[i].
+        """
+        gaps = np.zeros((self.number_of_sequences, len(self) + 2), dtype=np.int8)
+        gaps[:, 1:-1] = self.encoded == self.alphabet.find(self.gap_character)
+
+        changes = np.diff(gaps, axis=1)
+        sequences, starts = np.nonzero(changes == 1)
+        _, ends = np.nonzero(changes == -1)
+
+        return sequences, starts, ends
+
+    def get_gaps_before(self) -> np.ndarray:
+        """
+        Prefix sums of the gaps of every sequence, in the narrowest unsigned type holding the length of the alignment
+        (so usually 2 bytes per position). They aren't cached, for the same reason as :meth:`get_gap_runs`.
+
+        :return: N×(L+1) matrix holding, at position (i, k), the number of gaps of the i-th sequence before the k-th
+            column.
+        """
+        gaps_before = np.zeros((self.number_of_sequences, len(self) + 1), dtype=np.min_scalar_type(len(self)))
+        np.cumsum(self.encoded == self.alphabet.find(self.gap_character), axis=1, out=gaps_before[:, 1:])
+
+        return gaps_before
+
+    @property
+    def gap_mask(self) -> np.ndarray:
+        """
+        Bit-packed gap mask of the alignment, computed once and cached: bit k % 8 (least significant first) of byte
+        k // 8 of the i-th row is set if the i-th sequence has a gap at the k-th column. Padding bits are 0.
+
+        :return: N×⌈L/8⌉ matrix of bytes.
+        """
+        if self._gap_mask is None:
+            gap_index = self.alphabet.find(self.gap_character)
+            gap_mask = np.zeros((self.number_of_sequences, -(-len(self) // 8)), dtype=np.uint8)
+
+            if gap_index >= 0:
+                # in blocks of columns (multiple of 8), so no N×L temporary is built
+                for start in range(0, len(self), 8 * 8192):
+                    gap_mask[:, start // 8:(start + 8 * 8192) // 8] = np.packbits(
+                        self.encoded[:, start:start + 8 * 8192] == gap_index, axis=1, bitorder='little')
+
+            self._gap_mask = gap_mask
+
+        return self._gap_mask
+
+    def get_gaps_per_column(self) -> np.ndarray:
+        """
+        :return: Number of gaps of every column.
+        """
+        gap_mask = self.gap_mask
+        gaps = np.empty((gap_mask.shape[1], 8), dtype=np.int64)
+
+        for bit in range(8):
+            gaps[:, bit] = np.count_nonzero(gap_mask & np.uint8(1 << bit), axis=0)
+
+        return gaps.ravel()[:len(self)]
+
+    def get_gaps_per_sequence(self) -> np.ndarray:
+        """
+        :return: Number of gaps of every sequence.
+        """
+        return POPCOUNT[self.gap_mask].sum(axis=1, dtype=np.int64)
+
+    def get_gap_openings_per_sequence(self) -> np.ndarray:
+        """
+        :return: Number of gaps opened (i.e., runs of consecutive gaps) by every sequence.
+        """
+        gap_mask = self.gap_mask
+
+        # gap bit of the previous column of every column, carrying the last bit of the previous byte
+        previous = gap_mask << np.uint8(1)
+        previous[:, 1:] |= gap_mask[:, :-1] >> np.uint8(7)
+
+        return POPCOUNT[gap_mask & ~previous].sum(axis=1, dtype=np.int64)
+
+    def get_gap_only_columns(self) -> np.ndarray:
+        """
+        :return: Whether every column is only made of gaps.
+        """
+        gap_only = np.bitwise_and.reduce(self.gap_mask, axis=0)
+        return np.unpackbits(gap_only, bitorder='little', count=len(self)).astype(bool)
+
+    def get_sequence_weights(self, weighting: str = 'henikoff', threshold: float = 0.62) -> np.ndarray:
+        """
+        Weights of the sequences, cached with the column statistics so they are shared by every score.
+
+        :param weighting: Either 'henikoff' (position-based weights) or 'clustering' (identity clustering).
+        :param threshold: Identity threshold of the clustering.
+        :return: Weight of every sequence, normalized to sum N.
+        """
+        return self.column_statistics.get_sequence_weights(weighting, threshold)
+
     @property
     def number_of_sequences(self) -> int:
         """
         :return: Number of sequences within the alignment.
         """
+        if self._sequences is None:
+            return self._encoded.shape[0]
+
         return len(self._sequences)
 
     @property
     def is_valid(self) -> bool:
+        if self._sequences is None:
+            return self.number_of_sequences >= 2
+
         return all(len(seq) == len(self.sequences[0]) for seq in self._sequences[:1]) and len(self._sequences) >= 2
 
     def __len__(self) -> int:
         """
         :return: Total length of the alignment.
         """
+        if self._sequences is None:
+            return self._encoded.shape[1]
+
         return len(self.sequences[0])
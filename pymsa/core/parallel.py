@@ -0,0 +1,72 @@
+import copy
+import os
+
+import numpy as np
+
+from pymsa.core.msa import MSA
+from pymsa.core.score import Score
+
+_WORKER = {}
+
+
+def _attach(name: str, shape: tuple, alphabet: str, gap_character: str, score: Score) -> None:
+    from multiprocessing.shared_memory import SharedMemory
+
+    shared_memory = SharedMemory(name=name)
+
+    _WORKER['shared_memory'] = shared_memory
+    _WORKER['encoded'] = np.ndarray(shape, dtype=np.uint8, buffer=shared_memory.buf)
+    _WORKER['alphabet'] = alphabet
+    _WORKER['gap_character'] = gap_character
+    _WORKER['score'] = score
+
+
+def _compute_chunk(start: int, end: int):
+    score = copy.copy(_WORKER['score'])
+    score.msa = MSA.from_encoded(_WORKER['encoded'][:, start:end], _WORKER['alphabet'],
+                                 gap_character=_WORKER['gap_character'])
+
+    return score.get_column_scores().sum().item()
+
+
+def compute_in_parallel(score: Score, processes: int = None, chunk_size: int = None) -> float:
+    """
+    Compute a score by splitting the columns of the alignment into chunks that are scored by a pool of processes.
+    The encoded alignment is placed in shared memory, so workers read it without any copy.
+
+    :param score: Score to compute.
+    :param processes: Number of worker processes (all the CPUs by default).
+    :param chunk_size: Number of columns per chunk (by default, four chunks per process).
+    :return: Value of the score.
+    """
+    # imported here, as multiprocessing is slow to import and only needed by this function
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing.shared_memory import SharedMemory
+
+    if not score.is_column_separable():
+        raise Exception('Scores that are not column separable can\'t be computed in parallel')
+
+    msa = score.msa
+    processes = processes or os.cpu_count()
+    chunk_size = chunk_size or max(1, -(-len(msa) // (processes * 4)))
+
+    encoded = msa.encoded
+    shared_memory = SharedMemory(create=True, size=max(1, encoded.nbytes))
+
+    try:
+        np.ndarray(encoded.shape, dtype=np.uint8, buffer=shared_memory.buf)[:] = encoded
+
+        template = copy.copy(score)
+        template.msa = None
+
+        starts = range(0, len(msa), chunk_size)
+        ends = [min(start + chunk_size, len(msa)) for start in starts]
+
+        with ProcessPoolExecutor(processes, initializer=_attach, initargs=(
+                shared_memory.name, encoded.shape, msa.alphabet, msa.gap_character, template)) as executor:
+            final_score = sum(executor.map(_compute_chunk, starts, ends))
+    finally:
+        shared_memory.close()
+        shared_memory.unlink()
+
+    return score.aggregate(final_score, len(msa), msa.number_of_sequences)
@@ -0,0 +1,38 @@
+from collections import defaultdict
+from typing import List
+
+import numpy as np
+
+from pymsa.core.evaluator import Evaluator
+from pymsa.core.msa import MSA, encode
+from pymsa.core.statistics import ColumnStatistics
+
+
+def score_population(population: List[MSA], objectives: list) -> np.ndarray:
+    """
+    Score a population of alignments of the same sequences, as evaluated every generation by an evolutionary
+    optimizer. Alignments of equal size are stacked into a single (P, N, L) encoded array, so the column statistics
+    of the whole group are built once and shared by every objective.
+
+    :param population: Alignments to score.
+    :param objectives: Score classes, or tuples (score class, *arguments) where the arguments are those following
+        the alignment in the constructor of the score, e.g., `[Entropy, (SumOfPairs, Blosum62())]`.
+    :return: Matrix of scores with one row per objective and one column per alignment.
+    """
+    evaluator = Evaluator(objectives)
+    scores = np.empty((len(evaluator.objectives), len(population)))
+
+    groups = defaultdict(list)
+    for i, msa in enumerate(population):
+        groups[(msa.number_of_sequences, len(msa))].append(i)
+
+    for (number_of_sequences, length), indexes in groups.items():
+        alignments = [population[i] for i in indexes]
+        sequences = ''.join(seq for msa in alignments for seq in msa.sequences)
+        raw = np.frombuffer(sequences.encode('ascii'), dtype=np.uint8)
+        encoded, alphabet = encode(raw.reshape(len(indexes), number_of_sequences, length))
+        statistics = ColumnStatistics(encoded, alphabet, alignments[0].gap_character)
+
+        scores[:, indexes] = evaluator.evaluate_statistics(statistics, alignments)
+
+    return scores
@@ -0,0 +1,67 @@
+import numpy as np
+
+
+class ScoreProfile:
+    """
+    Score of every column of an alignment, along with their prefix sums, so the score of any window of columns is
+    computed in O(1), and the scores of all the windows of a given width in O(L).
+    """
+
+    def __init__(self, column_scores: np.ndarray, minimization: bool = False):
+        """
+        :param column_scores: Score of every column.
+        :param minimization: Whether lower scores are better (see :meth:`Score.is_minimization`).
+        """
+        self.column_scores = np.asarray(column_scores)
+        self.minimization = minimization
+
+        self.prefix_sums = np.zeros(len(self.column_scores) + 1, dtype=np.result_type(self.column_scores, np.int64))
+        np.cumsum(self.column_scores, out=self.prefix_sums[1:])
+
+    def get_window_score(self, start: int, end: int) -> float:
+        """
+        :return: Sum of the scores of the columns [start, end).
+        """
+        assert 0 <= start <= end <= len(self), 'Window is not valid'
+
+        return (self.prefix_sums[end] - self.prefix_sums[start]).item()
+
+    def get_window_scores(self, width: int, step: int = 1) -> np.ndarray:
+        """
+        Sliding-window profile of the alignment.
+
+        :param width: Number of columns of every window.
+        :param step: Distance between the starts of consecutive windows.
+        :return: Sum of the scores of the windows [i, i + width), for i = 0, step, 2·step... (while they fit in the
+            alignment).
+        """
+        assert 0 < width <= len(self) and step > 0, 'Window is not valid'
+
+        return (self.prefix_sums[width:] - self.prefix_sums[:-width])[::step]
+
+    def get_worst_windows(self, width: int, number: int = 1) -> list:
+        """
+        Locate poorly aligned regions, i.e., the non-overlapping windows with the worst scores.
+
+        :param width: Number of columns of every window.
+        :param number: Maximum number of windows to return.
+        :return: Starting column of the windows, from worst to best.
+        """
+        window_scores = self.get_window_scores(width)
+        order = np.argsort(-window_scores if self.minimization else window_scores, kind='stable')
+
+        starts = []
+        taken = np.zeros(len(self), dtype=bool)
+
+        for start in order.tolist():
+            if len(starts) == number:
+                break
+
+            if not taken[start] and not taken[start + width - 1]:
+                starts.append(start)
+                taken[start:start + width] = True
+
+        return starts
+
+    def __len__(self) -> int:
+        return len(self.column_scores)
@@ -1,15 +1,19 @@
+import copy
 import itertools
 import logging
 import math
 import os
-import urllib.request
 from abc import abstractmethod, ABC
 from collections import Counter
-from pathlib import Path
-from urllib.error import HTTPError
 
+import numpy as np
+
+from pymsa.core.instrumentation import measure
 from pymsa.core.msa import MSA
+from pymsa.core.profile import ScoreProfile
+from pymsa.core.statistics import ColumnStatistics
 from pymsa.core.substitution_matrix import SubstitutionMatrix, PAM250
+from pymsa.util.pdb import PDBFetcher
 from pymsa.util.tool import StrikeEx
 
 LOGGER = logging.getLogger('pyMSA')
@@ -27,6 +31,16 @@ def get_score_of_two_chars(substitution_matrix: SubstitutionMatrix, char_a: str,
     return int(substitution_matrix.get_distance(char_a, char_b))
 
 
+def get_substitution_matrix(substitution_matrix: SubstitutionMatrix = None) -> SubstitutionMatrix:
+    """
+    :return: The given substitution matrix or, by default, the shared PAM250 matrix.
+    """
+    if substitution_matrix is None:
+        return PAM250.shared()
+
+    return substitution_matrix
+
+
 class Score(ABC):
 
     def __init__(self, msa: MSA):
@@ -34,11 +48,65 @@ class Score(ABC):
         assert self.msa.is_valid, 'MSA is not valid'
 
     def compute(self) -> float:
-        final_score = 0
+        with measure(type(self).__name__, len(self.msa)):
+            final_score = self.get_column_scores().sum().item()
 
-        for k in range(len(self.msa)):
-            final_score += self.get_column_score(k)
+        return self.aggregate(final_score, len(self.msa), self.msa.number_of_sequences)
+
+    def get_column_scores(self) -> np.ndarray:
+        """
+        :return: Score of every column of the alignment.
+        """
+        return np.array([self.get_column_score(k) for k in range(len(self.msa))])
+
+    def get_sequence_contributions(self) -> np.ndarray:
+        """
+        Contribution of every sequence to the score, i.e., the value of the score minus its value once the sequence
+        is removed from the alignment (e.g., to find outliers). By default, the score is computed again without each
+        sequence; scores that can derive the contributions from the column statistics override this.
+
+        :return: Contribution of every sequence.
+        """
+        final_score = self.compute()
+        contributions = []
+
+        for i in range(self.msa.number_of_sequences):
+            score = copy.copy(self)
+            score.msa = MSA.from_encoded(np.delete(self.msa.encoded, i, axis=0), self.msa.alphabet,
+                                         gap_character=self.msa.gap_character)
+            contributions.append(final_score - score.compute())
+
+        return np.array(contributions)
+
+    def get_profile(self) -> ScoreProfile:
+        """
+        :return: Profile of the score along the alignment, to query the score of windows of columns.
+        """
+        return ScoreProfile(self.get_column_scores(), self.is_minimization())
+
+    @staticmethod
+    def supports_statistics(stacked: bool = False) -> bool:
+        """
+        Whether the score provides `get_column_scores_from_statistics(statistics, *args)`, computing the score of
+        every column (with shape (..., L)) from the column statistics of one or more (stacked) alignments, so the
+        score can be evaluated without building an instance per alignment. Its arguments are the same as those of
+        the constructor after the alignment.
 
+        :param stacked: Whether the statistics are those of several stacked alignments.
+        :return: Whether column scores can be computed from the statistics.
+        """
+        return False
+
+    @staticmethod
+    def aggregate(final_score, length: int, number_of_sequences: int):
+        """
+        Turn the sum of the column scores into the value of the score.
+
+        :param final_score: Sum of the column scores (a number or an array of them).
+        :param length: Length of the alignment.
+        :param number_of_sequences: Number of sequences within the alignment.
+        :return: Value of the score.
+        """
         return final_score
 
     def get_column(self, k: int) -> list:
@@ -53,9 +121,59 @@ class Score(ABC):
     def is_minimization() -> bool:
         pass
 
+    @staticmethod
+    def is_column_separable() -> bool:
+        """
+        :return: Whether the score only depends on the contents of each column, so it can be computed over separate
+            chunks of columns (e.g., in parallel or out of core).
+        """
+        return True
+
 
 class Entropy(Score):
 
+    def get_column_scores(self) -> np.ndarray:
+        return self.get_column_scores_from_statistics(self.msa.column_statistics)
+
+    @staticmethod
+    def supports_statistics(stacked: bool = False) -> bool:
+        return True
+
+    @staticmethod
+    def get_column_scores_from_statistics(statistics: ColumnStatistics) -> np.ndarray:
+        """
+        Compute the entropy of every column at once from the histograms of residues.
+
+        :param statistics: Column statistics of the alignment.
+        :return: Score of every column.
+        """
+        return Entropy.get_entropy_terms(statistics.counts, statistics.number_of_sequences).sum(axis=-2)
+
+    def get_sequence_contributions(self) -> np.ndarray:
+        """
+        Leave-one-out contributions (see :meth:`Score.get_sequence_contributions`), derived from the histograms of
+        residues: removing a sequence holding residue a from column k only changes the number of sequences and the
+        count of a, so the entropy of the column without it is computed for every residue at once.
+        """
+        statistics = self.msa.column_statistics
+        counts = statistics.counts
+        number_of_sequences = statistics.number_of_sequences
+
+        column_scores = self.get_entropy_terms(counts, number_of_sequences).sum(axis=0)
+        remaining_terms = self.get_entropy_terms(counts, number_of_sequences - 1)
+        column_scores_without = remaining_terms.sum(axis=0) - remaining_terms + \
+            self.get_entropy_terms(counts - 1, number_of_sequences - 1)
+
+        return statistics.sum_by_sequence(column_scores - column_scores_without)
+
+    @staticmethod
+    def get_entropy_terms(counts: np.ndarray, number_of_sequences: int) -> np.ndarray:
+        """
+        :return: Terms p·log(p) of the entropy, where p are the frequencies of the residues (0 for missing ones).
+        """
+        frequencies = counts / number_of_sequences
+        return frequencies * np.log(frequencies, out=np.zeros_like(frequencies), where=counts > 0)
+
     def get_column_score(self, k) -> float:
         column = self.get_column(k)
         column_chars_and_frequencies = self.get_words_frequencies(column)
@@ -92,9 +210,76 @@ class Entropy(Score):
 
 class Star(Score):
 
-    def __init__(self, msa: MSA, substitution_matrix: SubstitutionMatrix = PAM250()):
+    def __init__(self, msa: MSA, substitution_matrix: SubstitutionMatrix = None):
         super(Star, self).__init__(msa=msa)
-        self.substitution_matrix = substitution_matrix
+        self.substitution_matrix = get_substitution_matrix(substitution_matrix)
+
+    def get_column_scores(self) -> np.ndarray:
+        return self.get_column_scores_from_statistics(self.msa.column_statistics, self.substitution_matrix)
+
+    @staticmethod
+    def supports_statistics(stacked: bool = False) -> bool:
+        return True
+
+    @staticmethod
+    def get_column_scores_from_statistics(statistics: ColumnStatistics,
+                                          substitution_matrix: SubstitutionMatrix = None) -> np.ndarray:
+        """
+        Compute the star score of every column as the dot product between its histogram of residues and the row of
+        the substitution table corresponding to its consensus residue.
+
+        :param statistics: Column statistics of the alignment.
+        :param substitution_matrix: Matrix of scores such as PAM250, Blosum62, etc. (PAM250 by default).
+        :return: Score of every column.
+        """
+        table = get_substitution_matrix(substitution_matrix).compile(statistics.alphabet)
+        return np.einsum('...ka,...ak->...k', table[statistics.consensus], statistics.counts)
+
+    def get_sequence_contributions(self) -> np.ndarray:
+        """
+        Leave-one-out contributions (see :meth:`Score.get_sequence_contributions`), derived from the histograms of
+        residues. Removing a sequence holding residue a from a column only changes the count of a (and its first
+        occurrence, if the sequence was the first holding it), so the new consensus is either a or the best of the
+        other residues; both cases are computed for every residue at once.
+        """
+        statistics = self.msa.column_statistics
+        table = self.substitution_matrix.compile(statistics.alphabet)
+        counts = statistics.counts
+        number_of_sequences = statistics.number_of_sequences
+
+        residues = np.arange(len(statistics.alphabet))[:, np.newaxis]
+        columns = np.arange(statistics.length)
+        minimum = np.iinfo(np.int64).min
+
+        # score of every column if its consensus was each residue
+        table_counts = table @ counts
+        column_scores = table_counts[statistics.consensus, columns]
+
+        # same ordering as the consensus (see ColumnStatistics.consensus), and best residue other than each one
+        key = counts * (number_of_sequences + 1) - statistics.first_occurrences
+        best = np.argmax(key, axis=0)
+        runner_up_key = key.copy()
+        runner_up_key[best, columns] = minimum
+        runner_up = np.argmax(runner_up_key, axis=0)
+
+        others = np.where(residues == best, runner_up, best)
+        others_key = key[others, columns]
+
+        column_scores_without = []
+
+        for first_occurrences in (statistics.first_occurrences, statistics.second_occurrences):
+            new_key = np.where(counts > 1, (counts - 1) * (number_of_sequences + 1) - first_occurrences, minimum)
+            consensus = np.where(new_key > others_key, residues, others)
+            column_scores_without.append(table_counts[consensus, columns] - table[consensus, residues])
+
+        # removing any but the first sequence holding each residue, and then correct those that are first
+        contributions = statistics.sum_by_sequence(column_scores - column_scores_without[0])
+
+        present = counts > 0
+        np.add.at(contributions, statistics.first_occurrences[present],
+                  (column_scores_without[0] - column_scores_without[1])[present])
+
+        return contributions
 
     def get_column_score(self, k: int) -> float:
         column = self.get_column(k)
@@ -114,9 +299,45 @@ class Star(Score):
 
 class SumOfPairs(Score):
 
-    def __init__(self, msa: MSA, substitution_matrix: SubstitutionMatrix = PAM250()):
+    def __init__(self, msa: MSA, substitution_matrix: SubstitutionMatrix = None):
         super(SumOfPairs, self).__init__(msa=msa)
-        self.substitution_matrix = substitution_matrix
+        self.substitution_matrix = get_substitution_matrix(substitution_matrix)
+
+    def get_column_scores(self) -> np.ndarray:
+        return self.get_column_scores_from_statistics(self.msa.column_statistics, self.substitution_matrix)
+
+    @staticmethod
+    def supports_statistics(stacked: bool = False) -> bool:
+        return True
+
+    @staticmethod
+    def get_column_scores_from_statistics(statistics: ColumnStatistics,
+                                          substitution_matrix: SubstitutionMatrix = None) -> np.ndarray:
+        """
+        Compute the sum of pairs of every column from its histogram of residues, i.e., the sum of
+        c_a·c_b·S[a,b] over every pair of distinct residues plus c_a·(c_a-1)/2·S[a,a] for every residue.
+
+        :param statistics: Column statistics of the alignment.
+        :param substitution_matrix: Matrix of scores such as PAM250, Blosum62, etc. (PAM250 by default).
+        :return: Score of every column.
+        """
+        table = get_substitution_matrix(substitution_matrix).compile(statistics.alphabet)
+        counts = statistics.counts
+
+        all_pairs = np.einsum('...ak,...ak->...k', counts, table @ counts)
+        same_sequence_pairs = np.diagonal(table) @ counts
+
+        return (all_pairs - same_sequence_pairs) // 2
+
+    def get_sequence_contributions(self) -> np.ndarray:
+        """
+        Leave-one-out contributions (see :meth:`Score.get_sequence_contributions`), derived from the histograms of
+        residues: a sequence holding residue a in column k takes part in the pairs scoring (S·c)[a] - S[a,a].
+        """
+        statistics = self.msa.column_statistics
+        table = self.substitution_matrix.compile(statistics.alphabet)
+
+        return statistics.sum_by_sequence(table @ statistics.counts - np.diagonal(table)[:, np.newaxis])
 
     def get_column_score(self, k: int) -> float:
         column = self.get_column(k)
@@ -136,19 +357,164 @@ class SumOfPairs(Score):
         return False
 
 
-class PercentageOfNonGaps(Score):
+class WeightedSumOfPairs(SumOfPairs):
+    """
+    Sum of pairs where the score of every pair of sequences is multiplied by the product of their weights, so
+    redundant sequences do not dominate the score. With equal weights, the score is the plain sum of pairs.
+    """
 
-    def compute(self) -> float:
-        final_score = 0
+    def __init__(self, msa: MSA, substitution_matrix: SubstitutionMatrix = None, weighting: str = 'henikoff',
+                 threshold: float = 0.62):
+        super(WeightedSumOfPairs, self).__init__(msa=msa, substitution_matrix=substitution_matrix)
+        self.weighting = weighting
+        self.threshold = threshold
 
-        for k in range(len(self.msa)):
-            final_score += self.get_column_score(k)
+    def get_column_scores(self) -> np.ndarray:
+        return self.get_column_scores_from_statistics(self.msa.column_statistics, self.substitution_matrix,
+                                                      self.weighting, self.threshold)
 
-        return 100 - (final_score / (len(self.msa) * self.msa.number_of_sequences) * 100)
+    @staticmethod
+    def supports_statistics(stacked: bool = False) -> bool:
+        # weights are computed per alignment
+        return not stacked
+
+    @staticmethod
+    def get_column_scores_from_statistics(statistics: ColumnStatistics, substitution_matrix: SubstitutionMatrix = None,
+                                          weighting: str = 'henikoff', threshold: float = 0.62) -> np.ndarray:
+        """
+        Compute the weighted sum of pairs of every column from its weighted histograms of residues, as done by
+        :meth:`SumOfPairs.get_column_scores_from_statistics`.
+
+        :param statistics: Column statistics of the alignment.
+        :param substitution_matrix: Matrix of scores such as PAM250, Blosum62, etc. (PAM250 by default).
+        :param weighting: Either 'henikoff' (position-based weights) or 'clustering' (identity clustering).
+        :param threshold: Identity threshold of the clustering.
+        :return: Score of every column.
+        """
+        assert statistics.encoded.ndim == 2, 'Weights can\'t be computed over stacked alignments'
+
+        weights = statistics.get_sequence_weights(weighting, threshold)
+        weighted_counts, squared_weighted_counts = statistics.get_weighted_counts(weights)
+        table = get_substitution_matrix(substitution_matrix).compile(statistics.alphabet)
+
+        all_pairs = np.einsum('ak,ak->k', weighted_counts, table @ weighted_counts)
+        same_sequence_pairs = np.diagonal(table) @ squared_weighted_counts
+
+        return (all_pairs - same_sequence_pairs) / 2
+
+    def get_sequence_contributions(self) -> np.ndarray:
+        # removing a sequence changes the weights of the others
+        return Score.get_sequence_contributions(self)
 
     def get_column_score(self, k: int) -> float:
         column = self.get_column(k)
-        return column.count('-')
+        weights = self.msa.get_sequence_weights(self.weighting, self.threshold)
+
+        score_of_column = 0
+        for (i, char_a), (j, char_b) in self.possible_combinations(enumerate(column)):
+            score_of_column += weights[i] * weights[j] * get_score_of_two_chars(self.substitution_matrix, char_a,
+                                                                                char_b)
+
+        return score_of_column
+
+    @staticmethod
+    def is_column_separable() -> bool:
+        # the weights of the sequences depend on every column
+        return False
+
+
+class AffineSumOfPairs(SumOfPairs):
+    """
+    Sum of pairs with affine gap penalties: for every pair of sequences, each gap opened in their pairwise alignment
+    (i.e., ignoring the columns where both have gaps) costs `gap_open`, and each gap position facing a residue
+    costs `gap_extend`. Gap-gap pairs score 0.
+
+    The openings of a sequence are found with interval arithmetic over its precomputed gap runs (see
+    :meth:`MSA.get_gap_runs`): a run opens a gap against another sequence unless that sequence has gaps in all the
+    columns of the run. Openings are attributed to the column where the run starts, so this score is not column
+    separable.
+    """
+
+    def __init__(self, msa: MSA, substitution_matrix: SubstitutionMatrix = None, gap_open: int = -10,
+                 gap_extend: int = -1):
+        super(AffineSumOfPairs, self).__init__(msa=msa, substitution_matrix=substitution_matrix)
+        self.gap_open = gap_open
+        self.gap_extend = gap_extend
+
+    def get_column_scores(self) -> np.ndarray:
+        statistics = self.msa.column_statistics
+        gap_index = statistics.alphabet.find(statistics.gap_character)
+
+        table = self.substitution_matrix.compile(statistics.alphabet)
+        counts = statistics.counts
+
+        if gap_index >= 0:
+            table = table.copy()
+            table[gap_index, :] = table[:, gap_index] = self.gap_extend
+            table[gap_index, gap_index] = 0
+
+        all_pairs = np.einsum('ak,ak->k', counts, table @ counts)
+        same_sequence_pairs = np.diagonal(table) @ counts
+
+        return (all_pairs - same_sequence_pairs) // 2 + self.gap_open * self.get_gap_openings()
+
+    @staticmethod
+    def supports_statistics(stacked: bool = False) -> bool:
+        # gap openings depend on the order of the sequences in every column, missing from the statistics
+        return False
+
+    def get_sequence_contributions(self) -> np.ndarray:
+        # removing a sequence changes the gaps opened by the others
+        return Score.get_sequence_contributions(self)
+
+    def get_gap_openings(self) -> np.ndarray:
+        """
+        :return: Number of gaps opened in every column, over all the (ordered) pairs of sequences.
+        """
+        sequences, starts, ends = self.msa.get_gap_runs()
+        gaps_before = self.msa.get_gaps_before()
+        openings = np.zeros(len(starts), dtype=np.int64)
+
+        for first in range(0, len(starts), 4096):
+            block = slice(first, first + 4096)
+            gaps_in_run = gaps_before[:, ends[block]] - gaps_before[:, starts[block]]
+            covering_sequences = np.count_nonzero(gaps_in_run == ends[block] - starts[block], axis=0)
+            openings[block] = self.msa.number_of_sequences - covering_sequences
+
+        return np.bincount(starts, weights=openings, minlength=len(self.msa)).astype(np.int64)
+
+    def get_column_score(self, k: int) -> float:
+        return self.get_column_scores()[k].item()
+
+    @staticmethod
+    def is_column_separable() -> bool:
+        return False
+
+
+class PercentageOfNonGaps(Score):
+
+    def get_column_scores(self) -> np.ndarray:
+        return self.msa.get_gaps_per_column()
+
+    @staticmethod
+    def supports_statistics(stacked: bool = False) -> bool:
+        return True
+
+    @staticmethod
+    def get_column_scores_from_statistics(statistics: ColumnStatistics) -> np.ndarray:
+        gap_index = statistics.alphabet.find(statistics.gap_character)
+
+        if gap_index < 0:
+            return np.zeros(statistics.counts.shape[:-2] + (statistics.length,), dtype=np.int64)
+
+        return statistics.counts[..., gap_index, :]
+
+    @staticmethod
+    def aggregate(final_score, length: int, number_of_sequences: int):
+        return 100 - (final_score / (length * number_of_sequences) * 100)
+
+    def get_column_score(self, k: int) -> float:
+        return np.count_nonzero(self.msa.gap_mask[:, k // 8] & np.uint8(1 << k % 8))
 
     @staticmethod
     def is_minimization() -> bool:
@@ -157,13 +523,20 @@ class PercentageOfNonGaps(Score):
 
 class PercentageOfTotallyConservedColumns(Score):
 
-    def compute(self) -> float:
-        final_score = 0
+    def get_column_scores(self) -> np.ndarray:
+        return self.get_column_scores_from_statistics(self.msa.column_statistics)
+
+    @staticmethod
+    def supports_statistics(stacked: bool = False) -> bool:
+        return True
 
-        for k in range(len(self.msa)):
-            final_score += self.get_column_score(k)
+    @staticmethod
+    def get_column_scores_from_statistics(statistics: ColumnStatistics) -> np.ndarray:
+        return (np.count_nonzero(statistics.counts, axis=-2) <= 1).astype(np.int64)
 
-        return final_score / len(self.msa) * 100
+    @staticmethod
+    def aggregate(final_score, length: int, number_of_sequences: int):
+        return final_score / length * 100
 
     def get_column_score(self, k: int) -> float:
         column = self.get_column(k)
@@ -181,53 +554,74 @@ class PercentageOfTotallyConservedColumns(Score):
 
 class Strike:
 
-    def __init__(self, aligned_sequences: list, exe_path: str = '/usr/local/bin/strike'):
+    def __init__(self, aligned_sequences: list, exe_path: str = '/usr/local/bin/strike', fetcher: PDBFetcher = None):
         self.aligned_sequences = aligned_sequences
         self.no_sequences = len(self.aligned_sequences)
         self.length = len(self.aligned_sequences[0])
 
-        self.out_connection_path = os.path.abspath('strike/in.con')
-        self.out_alignment_path = os.path.abspath('strike/aln.fa')
         self.exe_path = os.path.abspath(exe_path)
+        self.fetcher = fetcher or PDBFetcher()
 
     def compute(self, sequences_id: list, chains: list) -> float:
         return self.evaluate(sequences_id, chains)
 
-    def evaluate(self, sequences_id: list, chains: list) -> float:
-        os.makedirs(os.path.abspath('strike'), exist_ok=True)
+    def evaluate(self, sequences_id: list, chains: list, pdb_paths: list = None) -> float:
+        """
+        Run STRIKE over the alignment. Input files are written to a temporary work directory of their own, so
+        evaluations never share (or reuse) files.
+
+        :param pdb_paths: Paths of the PDB files of the sequences, if already fetched.
+        """
+        # imported here, as it is only needed by Strike
+        import tempfile
+
+        if pdb_paths is None:
+            pdb_paths = self.fetcher.fetch_all(sequences_id[:self.no_sequences])
+
+        with tempfile.TemporaryDirectory(prefix='strike-') as work_directory:
+            connection_path = os.path.join(work_directory, 'in.con')
+            alignment_path = os.path.join(work_directory, 'aln.fa')
 
-        if not Path(self.out_connection_path).is_file() and not Path(self.out_alignment_path).is_file():
-            with open(self.out_connection_path, 'w+') as c_file, open(self.out_alignment_path, 'w+') as a_file:
+            with open(connection_path, 'w+') as c_file, open(alignment_path, 'w+') as a_file:
                 for i in range(self.no_sequences):
-                    self.get_pdb(sequences_id[i])
-                    c_file.writelines(
-                        sequences_id[i] + ' ' + os.path.abspath('strike') + '/' + sequences_id[i] + '.pdb ' + chains[
-                            i] + '\n')
+                    c_file.writelines(sequences_id[i] + ' ' + pdb_paths[i] + ' ' + chains[i] + '\n')
                     a_file.writelines('>' + sequences_id[i] + '\n' + self.aligned_sequences[i] + '\n')
 
-        return StrikeEx(os.path.abspath(self.exe_path)).run(
-            parameters={'-c': self.out_connection_path, '-a': self.out_alignment_path})
-
-    @staticmethod
-    def get_pdb(pdb_id: str) -> str:
-        base_url = 'https://files.rcsb.org/download/'
-        base_url += pdb_id + '.pdb'
+            return StrikeEx(self.exe_path).run(parameters={'-c': connection_path, '-a': alignment_path})
 
-        out_pdb_path = 'strike/' + pdb_id + '.pdb'
+    @classmethod
+    def evaluate_population(cls, population: list, sequences_id: list, chains: list,
+                            exe_path: str = '/usr/local/bin/strike', max_workers: int = None,
+                            fetcher: PDBFetcher = None) -> list:
+        """
+        Run STRIKE over several alignments of the same sequences concurrently, in a bounded pool of workers. PDB
+        files are fetched once for the whole population.
+
+        :param population: Alignments, each one given as a list of aligned sequences.
+        :param sequences_id: PDB identifiers of the sequences.
+        :param chains: Chains of the sequences.
+        :param exe_path: Path of the STRIKE executable.
+        :param max_workers: Maximum number of concurrent runs (the number of CPUs by default).
+        :param fetcher: Fetcher of PDB files.
+        :return: Score of every alignment.
+        """
+        # imported here, as it is only needed by Strike
+        from concurrent.futures import ThreadPoolExecutor
 
-        if not Path(out_pdb_path).is_file():
-            LOGGER.debug('Downloading .pdb file...')
+        fetcher = fetcher or PDBFetcher()
+        pdb_paths = fetcher.fetch_all(sequences_id)
 
-            try:
-                req = urllib.request.Request(base_url)
-                f = urllib.request.urlopen(req)
-            except HTTPError:
-                raise Exception("PDB not found in rcsb")
+        strikes = [cls(aligned_sequences, exe_path, fetcher) for aligned_sequences in population]
 
-            with open(out_pdb_path, 'w+') as pdb_file:
-                pdb_file.write(f.read().decode('unicode_escape'))
+        with ThreadPoolExecutor(max_workers or os.cpu_count()) as executor:
+            return list(executor.map(lambda strike: strike.evaluate(sequences_id, chains, pdb_paths), strikes))
 
-        return out_pdb_path
+    @staticmethod
+    def get_pdb(pdb_id: str, fetcher: PDBFetcher = None) -> str:
+        """
+        :return: Path of the PDB file in the local cache (see :class:`PDBFetcher`), downloading it if needed.
+        """
+        return (fetcher or PDBFetcher()).fetch(pdb_id)
 
     @staticmethod
     def is_minimization() -> bool:
@@ -0,0 +1,156 @@
+import numpy as np
+
+from pymsa.core.weights import BLOCK_SIZE, henikoff_weights, clustering_weights
+
+
+class ColumnStatistics:
+    """
+    Per-column residue statistics of an encoded alignment.
+
+    The encoded matrix is expected to have shape (..., N, L); any leading dimensions (e.g. a stack of alignments of
+    the same size) are kept by every statistic. Statistics are computed the first time they are requested.
+    """
+
+    def __init__(self, encoded: np.ndarray, alphabet: str, gap_character: str = '-'):
+        self.encoded = encoded
+        self.alphabet = alphabet
+        self.gap_character = gap_character
+
+        self._counts = None
+        self._first_occurrences = None
+        self._second_occurrences = None
+        self._consensus = None
+        self._sequence_weights = dict()
+
+    @property
+    def number_of_sequences(self) -> int:
+        return self.encoded.shape[-2]
+
+    @property
+    def length(self) -> int:
+        return self.encoded.shape[-1]
+
+    @property
+    def counts(self) -> np.ndarray:
+        """
+        :return: Histogram of residues of every column, with shape (..., A, L) where A is the size of the alphabet.
+        """
+        if self._counts is None:
+            counts = np.empty(self.encoded.shape[:-2] + (len(self.alphabet), self.length), dtype=np.int64)
+
+            for index in range(len(self.alphabet)):
+                counts[..., index, :] = np.count_nonzero(self.encoded == index, axis=-2)
+
+            self._counts = counts
+
+        return self._counts
+
+    @property
+    def first_occurrences(self) -> np.ndarray:
+        """
+        :return: Index of the first sequence holding each residue in every column, with shape (..., A, L). Residues
+            missing from a column are given N.
+        """
+        if self._first_occurrences is None:
+            first_occurrences = np.empty_like(self.counts)
+
+            for index in range(len(self.alphabet)):
+                first_occurrences[..., index, :] = np.argmax(self.encoded == index, axis=-2)
+
+            first_occurrences[self.counts == 0] = self.number_of_sequences
+            self._first_occurrences = first_occurrences
+
+        return self._first_occurrences
+
+    @property
+    def second_occurrences(self) -> np.ndarray:
+        """
+        :return: Index of the second sequence holding each residue in every column, with shape (..., A, L). Residues
+            appearing less than twice in a column are given N.
+        """
+        if self._second_occurrences is None:
+            second_occurrences = np.empty_like(self.counts)
+
+            for index in range(len(self.alphabet)):
+                occurrences = np.cumsum(self.encoded == index, axis=-2, dtype=np.int32)
+                second_occurrences[..., index, :] = np.argmax(occurrences == 2, axis=-2)
+
+            second_occurrences[self.counts < 2] = self.number_of_sequences
+            self._second_occurrences = second_occurrences
+
+        return self._second_occurrences
+
+    @property
+    def consensus(self) -> np.ndarray:
+        """
+        Most frequent residue of every column. Ties are broken in favour of the residue appearing first in the
+        column, as :meth:`collections.Counter.most_common` does.
+
+        :return: Encoded residue of every column, with shape (..., L).
+        """
+        if self._consensus is None:
+            key = self.counts * (self.number_of_sequences + 1) - self.first_occurrences
+            self._consensus = np.argmax(key, axis=-2)
+
+        return self._consensus
+
+    def get_sequence_weights(self, weighting: str = 'henikoff', threshold: float = 0.62) -> np.ndarray:
+        """
+        Weights of the sequences of a (single) alignment, cached per weighting scheme.
+
+        :param weighting: Either 'henikoff' (position-based weights) or 'clustering' (identity clustering).
+        :param threshold: Identity threshold of the clustering.
+        :return: Weight of every sequence, normalized to sum N.
+        """
+        key = (weighting, threshold) if weighting == 'clustering' else (weighting,)
+
+        if key not in self._sequence_weights:
+            if weighting == 'henikoff':
+                weights = henikoff_weights(self.encoded, self.counts)
+            elif weighting == 'clustering':
+                gap_index = self.alphabet.find(self.gap_character)
+                weights = clustering_weights(self.encoded, len(self.alphabet), gap_index, threshold)
+            else:
+                raise Exception('Unknown weighting scheme {}'.format(weighting))
+
+            weights.flags.writeable = False
+            self._sequence_weights[key] = weights
+
+        return self._sequence_weights[key]
+
+    def get_weighted_counts(self, weights: np.ndarray) -> tuple:
+        """
+        Weighted histograms of residues of a (single) alignment: the sum of the weights, and of the squared weights,
+        of the sequences holding each residue in every column.
+
+        :param weights: Weight of every sequence.
+        :return: Pair of A×L matrices.
+        """
+        weighted_counts = np.empty((len(self.alphabet), self.length))
+        squared_weighted_counts = np.empty((len(self.alphabet), self.length))
+
+        for start in range(0, self.length, BLOCK_SIZE):
+            block = self.encoded[:, start:start + BLOCK_SIZE]
+            size = block.shape[1]
+            indexes = (block.astype(np.intp) * size + np.arange(size)).ravel()
+
+            for counts, values in ((weighted_counts, weights), (squared_weighted_counts, weights ** 2)):
+                counts[:, start:start + size] = np.bincount(
+                    indexes, weights=np.repeat(values, size), minlength=len(self.alphabet) * size).reshape(-1, size)
+
+        return weighted_counts, squared_weighted_counts
+
+    def sum_by_sequence(self, values: np.ndarray) -> np.ndarray:
+        """
+        Sum, for every sequence of a (single) alignment, the values of the residues it holds in every column.
+
+        :param values: A×L matrix, where the value at position (a, k) is that of residue a in column k.
+        :return: Sum of every sequence.
+        """
+        sums = np.zeros(self.number_of_sequences, dtype=values.dtype)
+
+        for start in range(0, self.length, BLOCK_SIZE):
+            block = self.encoded[:, start:start + BLOCK_SIZE].astype(np.intp)
+            sums += np.take_along_axis(values[:, start:start + BLOCK_SIZE], block, axis=0).sum(axis=1)
+
+        return sums
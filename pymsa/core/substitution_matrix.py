@@ -1,5 +1,21 @@
-import re
+import os
+import threading
 from abc import ABC
+from collections import OrderedDict
+from types import MappingProxyType
+
+import numpy as np
+
+from pymsa.core.instrumentation import ACTIVE_METRICS, record_substitution_lookups, record_cache_access
+
+FILE_MATRIX_CACHE_SIZE = 32
+BINARY_CACHE_SUFFIX = '.npz'
+
+_file_matrix_cache = OrderedDict()
+_file_matrix_cache_lock = threading.Lock()
+
+_shared_instances = dict()
+_shared_instances_lock = threading.Lock()
 
 
 class SubstitutionMatrix(ABC):
@@ -9,6 +25,42 @@ class SubstitutionMatrix(ABC):
         self.gap_character = gap_character
 
         self.distance_matrix = dict()
+        self._compiled_tables = dict()
+
+    @classmethod
+    def shared(cls) -> 'SubstitutionMatrix':
+        """
+        Returns a process-wide instance of the matrix with its default arguments (e.g., `PAM250.shared()`), built on
+        first use. Shared instances are immutable, so they also share their compiled tables (see :meth:`compile`).
+
+        :return: Shared instance of the matrix.
+        """
+        instance = _shared_instances.get(cls)
+
+        if instance is None:
+            with _shared_instances_lock:
+                instance = _shared_instances.get(cls)
+
+                if instance is None:
+                    instance = cls()
+                    instance.distance_matrix = MappingProxyType(instance.distance_matrix)
+                    instance._frozen = True
+                    _shared_instances[cls] = instance
+
+        return instance
+
+    def __setattr__(self, name, value):
+        if getattr(self, '_frozen', False):
+            raise Exception('Shared substitution matrices can\'t be modified')
+
+        super(SubstitutionMatrix, self).__setattr__(name, value)
+
+    def __reduce__(self):
+        # shared instances are unpickled as the shared instance of the receiving process
+        if getattr(self, '_frozen', False):
+            return type(self).shared, ()
+
+        return super(SubstitutionMatrix, self).__reduce__()
 
     def get_distance(self, char1, char2) -> int:
         """
@@ -18,6 +70,9 @@ class SubstitutionMatrix(ABC):
         :param char2: Second character.
         :return: The distance value from the scoring matrix.
         """
+        if ACTIVE_METRICS:
+            record_substitution_lookups(1)
+
         if char1 is self.gap_character and char2 is self.gap_character:
             distance = 1
         elif char1 is self.gap_character or char2 is self.gap_character:
@@ -34,16 +89,114 @@ class SubstitutionMatrix(ABC):
     def get_distance_matrix(self) -> dict:
         return self.distance_matrix
 
+    def compile(self, alphabet: str) -> np.ndarray:
+        """
+        Returns the matrix as a dense, symmetric and read-only table indexed by encoded residue, i.e., the
+        value at position (i, j) is the distance between the i-th and j-th characters of the alphabet. Gap cells are
+        filled in too, so no further checks are needed when scoring. Tables are cached per alphabet.
+
+        :param alphabet: Characters of the encoded alignment (see :attr:`MSA.alphabet`).
+        :return: A×A table of distances.
+        """
+        key = (alphabet, self.gap_penalty, self.gap_character)
+
+        if ACTIVE_METRICS:
+            record_cache_access(key in self._compiled_tables)
+
+        if key not in self._compiled_tables:
+            matrix = self.get_distance_matrix()
+            table = np.empty((len(alphabet), len(alphabet)), dtype=np.int64)
+            missing = []
+
+            for i, char1 in enumerate(alphabet):
+                for j, char2 in enumerate(alphabet[:i + 1]):
+                    if char1 == self.gap_character and char2 == self.gap_character:
+                        distance = 1
+                    elif char1 == self.gap_character or char2 == self.gap_character:
+                        distance = self.gap_penalty
+                    elif (char1, char2) in matrix:
+                        distance = matrix[(char1, char2)]
+                    elif (char2, char1) in matrix:
+                        distance = matrix[(char2, char1)]
+                    else:
+                        missing.append('({0},{1})'.format(char1, char2))
+                        continue
+
+                    table[i, j] = table[j, i] = int(distance)
+
+            if missing:
+                raise Exception('The pairs {0} couldn\'t be found in the substitution matrix'
+                                .format(', '.join(missing)))
+
+            if ACTIVE_METRICS:
+                record_substitution_lookups(len(alphabet) * (len(alphabet) + 1) // 2)
+
+            table.flags.writeable = False
+            self._compiled_tables[key] = table
+
+        return self._compiled_tables[key]
+
 
 class FileMatrix(SubstitutionMatrix):
     """
     Read blast/matrix from file
 
+    Parsed files are kept in a process-wide LRU cache (of `FILE_MATRIX_CACHE_SIZE` files) keyed by their path and
+    modification time, so constructing the same matrix again doesn't read the file. With `binary_cache`, the parsed
+    matrix is also stored next to the file (with the suffix `BINARY_CACHE_SUFFIX`) and loaded from there by other
+    processes without any parsing.
+
     .. note:: Files can be found at ftp://ftp.ncbi.nih.gov/blast/matrices/
     """
-    def __init__(self, path: str, gap_penalty: int = -8, gap_character: str = '-'):
+    def __init__(self, path: str, gap_penalty: int = -8, gap_character: str = '-', binary_cache: bool = False):
         super(FileMatrix, self).__init__(gap_penalty, gap_character)
-        self.distance_matrix = self.read_matrix_from_file(path)
+        self.distance_matrix = self.load_matrix_from_file(path, binary_cache)
+
+    @classmethod
+    def load_matrix_from_file(cls, path_to_file: str, binary_cache: bool = False) -> dict:
+        """
+        Same as :meth:`read_matrix_from_file`, but going through the cache of parsed matrices.
+
+        :param path_to_file: Path of the matrix.
+        :param binary_cache: Whether to use (and create) a precompiled binary cache file next to the matrix.
+        :return: Distance matrix.
+        """
+        try:
+            stat = os.stat(path_to_file)
+        except FileNotFoundError:
+            raise Exception('File {} not found!'.format(path_to_file))
+
+        key = (os.path.abspath(path_to_file), stat.st_mtime_ns, stat.st_size)
+
+        with _file_matrix_cache_lock:
+            distance_matrix = _file_matrix_cache.get(key)
+
+            if distance_matrix is not None:
+                _file_matrix_cache.move_to_end(key)
+
+        if ACTIVE_METRICS:
+            record_cache_access(distance_matrix is not None)
+
+        if distance_matrix is None:
+            binary_path = path_to_file + BINARY_CACHE_SUFFIX
+
+            if binary_cache:
+                distance_matrix = cls.read_binary_cache(binary_path, key[1:])
+
+            if distance_matrix is None:
+                distance_matrix = cls.read_matrix_from_file(path_to_file)
+
+                if binary_cache:
+                    cls.write_binary_cache(binary_path, key[1:], distance_matrix)
+
+            with _file_matrix_cache_lock:
+                _file_matrix_cache[key] = distance_matrix
+
+                while len(_file_matrix_cache) > FILE_MATRIX_CACHE_SIZE:
+                    _file_matrix_cache.popitem(last=False)
+
+        # instances get their own copy, so the cached matrix can't be modified
+        return dict(distance_matrix)
 
     @staticmethod
     def read_matrix_from_file(path_to_file: str) -> dict:
@@ -52,23 +205,61 @@ class FileMatrix(SubstitutionMatrix):
 
         try:
             with open(path_to_file, 'r') as matrix:
-                for line in matrix.readlines():
+                for line in matrix:
                     if not line.startswith('#') and line.strip():
-                        # remove leading and trailing spaces and then replace consecutive whitespace characters
-                        tmp = re.sub("\s+", " ", line.strip()).split(" ")
+                        tmp = line.split()
 
                         # if not header was specified, use the first line from the input file
                         if line.startswith(' '):
                             header = tmp
                         else:
-                            for i in range(len(header) - 1):
-                                if (tmp[0], header[i + 1]) not in matrix and (header[i + 1], tmp[0]) not in matrix:
-                                    distance_matrix.update({(tmp[0], header[i]): int(tmp[i + 1])})
+                            for i in range(len(header)):
+                                distance_matrix[(tmp[0], header[i])] = int(tmp[i + 1])
         except FileNotFoundError:
             raise Exception('File {} not found!'.format(path_to_file))
 
         return distance_matrix
 
+    @staticmethod
+    def read_binary_cache(path: str, source: tuple):
+        """
+        :param path: Path of the binary cache file.
+        :param source: Modification time (in nanoseconds) and size of the matrix file.
+        :return: Distance matrix, or None if the cache file is missing, corrupt or stale.
+        """
+        import zipfile
+
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if tuple(data['source'].tolist()) != source:
+                    return None
+
+                return dict(zip(map(tuple, data['pairs'].tolist()), data['distances'].tolist()))
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            return None
+
+    @staticmethod
+    def write_binary_cache(path: str, source: tuple, distance_matrix: dict) -> None:
+        """
+        Store a distance matrix in a binary cache file. Errors (e.g., read-only directories) are ignored, as the
+        cache is optional.
+        """
+        import tempfile
+
+        try:
+            handle, temporary_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(handle, 'wb') as file:
+                np.savez(file, source=np.array(source, dtype=np.int64),
+                         pairs=np.array(list(distance_matrix.keys()), dtype=str).reshape(-1, 2),
+                         distances=np.array(list(distance_matrix.values()), dtype=np.int64))
+            os.replace(temporary_path, path)
+        except OSError:
+            os.remove(temporary_path)
+
 
 class PAM250(SubstitutionMatrix):
     """
@@ -0,0 +1,57 @@
+import numpy as np
+
+BLOCK_SIZE = 1024
+
+
+def henikoff_weights(encoded: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """
+    Compute position-based sequence weights (Henikoff & Henikoff, 1994): in every column, a sequence gets
+    1 / (r·c), where r is the number of different residues of the column and c the number of sequences sharing its
+    residue. Weights are normalized to sum N, so equal weights are all 1.
+
+    :param encoded: Encoded alignment (N×L).
+    :param counts: Histogram of residues of every column (A×L).
+    :return: Weight of every sequence.
+    """
+    inverses = np.zeros(counts.shape)
+    np.divide(1, np.count_nonzero(counts, axis=0) * counts, out=inverses, where=counts > 0)
+
+    weights = np.zeros(encoded.shape[0])
+    for start in range(0, encoded.shape[1], BLOCK_SIZE):
+        block = slice(start, start + BLOCK_SIZE)
+        weights += np.take_along_axis(inverses[:, block], encoded[:, block].astype(np.intp), axis=0).sum(axis=1)
+
+    return weights * len(weights) / weights.sum()
+
+
+def clustering_weights(encoded: np.ndarray, alphabet_size: int, gap_index: int, threshold: float) -> np.ndarray:
+    """
+    Compute sequence weights by identity clustering: every sequence gets 1 / n, where n is the number of sequences
+    (itself included) whose identity with it is at least the threshold. The identity of two sequences is the ratio
+    of identical residues over the columns where they are not both gaps. Weights are normalized to sum N.
+
+    :param encoded: Encoded alignment (N×L).
+    :param alphabet_size: Size of the alphabet.
+    :param gap_index: Encoded gap character (or -1 if the alignment has no gaps).
+    :param threshold: Identity threshold, between 0 and 1.
+    :return: Weight of every sequence.
+    """
+    number_of_sequences, length = encoded.shape
+    matches = np.zeros((number_of_sequences, number_of_sequences), dtype=np.float32)
+    both_gaps = np.zeros((number_of_sequences, number_of_sequences), dtype=np.float32)
+
+    for start in range(0, length, BLOCK_SIZE):
+        block = encoded[:, start:start + BLOCK_SIZE]
+
+        for index in range(alphabet_size):
+            mask = (block == index).astype(np.float32)
+
+            if index == gap_index:
+                both_gaps += mask @ mask.T
+            else:
+                matches += mask @ mask.T
+
+    identities = matches / np.maximum(length - both_gaps, 1)
+    weights = 1 / np.count_nonzero(identities >= threshold, axis=1)
+
+    return weights * len(weights) / weights.sum()
@@ -0,0 +1,79 @@
+import os
+import random
+import tempfile
+import unittest
+
+from pymsa.core.blocks import ColumnBlocks
+from pymsa.core.evaluator import Evaluator
+from pymsa.core.score import SumOfPairs, Star, Entropy, PercentageOfNonGaps, PercentageOfTotallyConservedColumns
+from pymsa.core.substitution_matrix import Blosum62
+from pymsa.util.fasta import read_fasta_file_as_msa
+
+
+class ColumnBlocksTestCases(unittest.TestCase):
+
+    def setUp(self):
+        generator = random.Random(0)
+        handle, self.file_name = tempfile.mkstemp(suffix='.fasta')
+
+        with os.fdopen(handle, 'w') as file:
+            for i in range(6):
+                sequence = ''.join(generator.choice('ARNDC-') for _ in range(50))
+                file.write('>seq{0}\n{1}\n{2}\n'.format(i, sequence[:30], sequence[30:]))
+
+    def tearDown(self):
+        os.remove(self.file_name)
+
+    def test_should_iterate_the_alignment_in_blocks_of_columns(self):
+        # setup
+        blocks = ColumnBlocks.from_fasta(self.file_name, block_size=16)
+
+        # results
+        result = [len(msa) for msa in blocks]
+
+        # check
+        self.assertEqual([16, 16, 16, 2], result)
+        self.assertEqual(6, blocks.number_of_sequences)
+        self.assertEqual(50, len(blocks))
+
+    def test_should_blocks_hold_the_columns_of_the_alignment(self):
+        # setup
+        blocks = ColumnBlocks.from_fasta(self.file_name, block_size=16)
+
+        # results
+        result = [''.join(sequences) for sequences in zip(*(msa.sequences for msa in blocks))]
+        expected = read_fasta_file_as_msa(self.file_name).sequences
+
+        # check
+        self.assertEqual(expected, result)
+
+    def test_should_evaluate_blocks_give_the_same_scores_as_the_whole_alignment(self):
+        # setup
+        evaluator = Evaluator([(SumOfPairs, Blosum62()), (Star, Blosum62()), Entropy, PercentageOfNonGaps,
+                               PercentageOfTotallyConservedColumns])
+
+        # results
+        result = evaluator.evaluate_blocks(ColumnBlocks.from_fasta(self.file_name, block_size=7))
+        expected = evaluator.evaluate(read_fasta_file_as_msa(self.file_name))
+
+        # check
+        for expected_value, value in zip(expected, result):
+            self.assertAlmostEqual(expected_value, value)
+
+    def test_should_read_blocks_from_a_saved_alignment(self):
+        # setup
+        msa = read_fasta_file_as_msa(self.file_name)
+        msa.save(self.file_name + '.msa')
+        self.addCleanup(os.remove, self.file_name + '.msa')
+
+        # results
+        result = Evaluator([(SumOfPairs, Blosum62())]).evaluate_blocks(
+            ColumnBlocks.from_file(self.file_name + '.msa', block_size=8))
+        expected = SumOfPairs(msa, Blosum62()).compute()
+
+        # check
+        self.assertEqual([expected], result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+
+from pymsa.cli import main, detect_format, find_files, get_objectives
+from pymsa.core.msa import MSA
+from pymsa.core.score import SumOfPairs, Entropy
+from pymsa.core.substitution_matrix import Blosum62, PAM250
+
+FASTA = '>seq1\nA-TGCAAT-G\n>seq2\n-CT-CCAT-A\n>seq3\n-TTAT-CTG-\n'
+CLUSTAL = 'CLUSTAL W (1.83) multiple sequence alignment\n\nseq1    A-TGCAAT-G\nseq2    -CT-CCAT-A\n' \
+          'seq3    -TTAT-CTG-\n        *  *\n'
+
+
+class CommandLineTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.alignments = os.path.join(self.directory.name, 'alignments')
+        self.write('a.fasta', FASTA)
+        self.write('b.aln', CLUSTAL)
+        self.write('nested/c.fasta', '>seq1\nAC\n>seq2\nA\n')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, file_name: str, contents: str) -> str:
+        path = os.path.join(self.alignments, file_name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, 'w') as file:
+            file.write(contents)
+
+        return path
+
+    def run_main(self, *args) -> tuple:
+        output = os.path.join(self.directory.name, 'output.txt')
+        exit_code = main(list(args) + ['--output', output])
+
+        with open(output) as file:
+            return exit_code, file.read()
+
+    def test_should_write_a_csv_line_per_file(self):
+        # setup
+        msa = MSA(['A-TGCAAT-G', '-CT-CCAT-A', '-TTAT-CTG-'])
+
+        # results
+        exit_code, output = self.run_main(os.path.join(self.alignments, 'a.fasta'), '-s', 'SumOfPairs', 'entropy',
+                                          '-m', 'Blosum62', 'PAM250')
+        rows = list(csv.DictReader(io.StringIO(output)))
+
+        # check
+        self.assertEqual(0, exit_code)
+        self.assertEqual(1, len(rows))
+        self.assertEqual(['file', 'sequences', 'length', 'SumOfPairs[Blosum62]', 'SumOfPairs[PAM250]', 'Entropy',
+                          'error'], list(rows[0].keys()))
+        self.assertEqual(('3', '10', ''), (rows[0]['sequences'], rows[0]['length'], rows[0]['error']))
+        self.assertEqual(SumOfPairs(msa, Blosum62()).compute(), int(rows[0]['SumOfPairs[Blosum62]']))
+        self.assertAlmostEqual(Entropy(msa).compute(), float(rows[0]['Entropy']))
+
+    def test_should_write_json_lines_and_report_errors(self):
+        # results
+        exit_code, output = self.run_main(self.alignments, '-s', 'PercentageOfNonGaps', '--json')
+        lines = [json.loads(line) for line in output.splitlines()]
+
+        # check
+        self.assertEqual(1, exit_code)
+        self.assertEqual(['a.fasta', 'b.aln', 'c.fasta'], [os.path.basename(line['file']) for line in lines])
+        self.assertEqual(lines[0]['PercentageOfNonGaps'], lines[1]['PercentageOfNonGaps'])
+        self.assertNotIn('error', lines[0])
+        self.assertIn('error', lines[2])
+
+    def test_should_compute_the_same_scores_with_several_workers(self):
+        # setup
+        pattern = os.path.join(self.alignments, '*.*')
+
+        # results
+        serial = self.run_main(pattern, '--json')
+        parallel = self.run_main(pattern, '--json', '--jobs', '2')
+
+        # check
+        self.assertEqual(serial, parallel)
+
+    def test_should_fail_if_a_score_or_a_path_is_unknown(self):
+        # results
+        with redirect_stderr(io.StringIO()):
+            unknown_score = main([self.alignments, '-s', 'Unknown'])
+            unknown_path = main([os.path.join(self.alignments, '*.unknown')])
+
+        # check
+        self.assertEqual(2, unknown_score)
+        self.assertEqual(2, unknown_path)
+
+    def test_should_fail_if_the_number_of_jobs_is_negative(self):
+        # results
+        with redirect_stderr(io.StringIO()) as stderr, self.assertRaises(SystemExit) as context:
+            main([self.alignments, '--jobs', '-1'])
+
+        # check
+        self.assertEqual(2, context.exception.code)
+        self.assertIn('is not a non-negative integer', stderr.getvalue())
+
+    def test_should_expand_directories_recursively(self):
+        # results
+        file_names = list(find_files([self.alignments]))
+
+        # check
+        self.assertEqual(['a.fasta', 'b.aln', 'c.fasta'], [os.path.basename(file_name) for file_name in file_names])
+
+    def test_should_detect_the_format_of_the_files(self):
+        # check
+        self.assertEqual('fasta', detect_format(os.path.join(self.alignments, 'a.fasta')))
+        self.assertEqual('clustal', detect_format(os.path.join(self.alignments, 'b.aln')))
+        self.assertEqual('stockholm', detect_format(self.write('d.sto', '# STOCKHOLM 1.0\nseq1 AC\n//\n')))
+        self.assertEqual('a2m', detect_format(self.write('e.a3m', FASTA)))
+
+    def test_should_evaluate_matrix_scores_with_every_matrix(self):
+        # results
+        objectives, names = get_objectives(['Star', 'Entropy'], ['PAM250', 'blosum62'])
+
+        # check
+        self.assertEqual(['Star[PAM250]', 'Star[blosum62]', 'Entropy'], names)
+        self.assertIs(PAM250.shared(), objectives[0][1])
+        self.assertIs(Blosum62.shared(), objectives[1][1])
+        self.assertIs(Entropy, objectives[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+
+from pymsa.core.evaluator import Evaluator
+from pymsa.core.msa import MSA
+from pymsa.core.score import SumOfPairs, WeightedSumOfPairs, AffineSumOfPairs, Star, Entropy, PercentageOfNonGaps, \
+    PercentageOfTotallyConservedColumns
+from pymsa.core.substitution_matrix import PAM250, Blosum62
+
+
+class EvaluatorTestCases(unittest.TestCase):
+
+    def test_should_evaluate_every_objective(self):
+        # setup
+        msa = MSA(['A-TGCAAT-G', '-CT-CCAT-A', '-TTAT-CTG-'])
+        evaluator = Evaluator([PercentageOfNonGaps, PercentageOfTotallyConservedColumns, Entropy,
+                               (SumOfPairs, Blosum62()), (Star, PAM250())])
+
+        # results
+        result = evaluator.evaluate(msa)
+        expected = [PercentageOfNonGaps(msa).compute(), PercentageOfTotallyConservedColumns(msa).compute(),
+                    Entropy(msa).compute(), SumOfPairs(msa, Blosum62()).compute(), Star(msa, PAM250()).compute()]
+
+        # check
+        self.assertEqual(len(expected), len(result))
+        for expected_value, value in zip(expected, result):
+            self.assertAlmostEqual(expected_value, value)
+
+    def test_should_use_the_default_substitution_matrix_if_none_is_given(self):
+        # setup
+        msa = MSA(['A-TGCAAT-G', '-CT-CCAT-A', '-TTAT-CTG-'])
+        evaluator = Evaluator([SumOfPairs, Star])
+
+        # results
+        scores = evaluator.evaluate(msa)
+
+        # check
+        self.assertEqual([SumOfPairs(msa, PAM250()).compute(), Star(msa, PAM250()).compute()], scores)
+
+    def test_should_integer_scores_be_returned_as_integers(self):
+        # setup
+        msa = MSA(['AA', 'AA', 'AA'])
+
+        # results
+        result = Evaluator([(SumOfPairs, PAM250())]).evaluate(msa)
+
+        # check
+        self.assertEqual([12], result)
+        self.assertIsInstance(result[0], int)
+
+    def test_should_scores_declare_whether_they_support_statistics(self):
+        # check
+        self.assertTrue(SumOfPairs.supports_statistics(stacked=True))
+        self.assertTrue(WeightedSumOfPairs.supports_statistics(stacked=False))
+        self.assertFalse(WeightedSumOfPairs.supports_statistics(stacked=True))
+        self.assertFalse(AffineSumOfPairs.supports_statistics(stacked=False))
+
+    def test_should_not_hide_errors_of_scores_supporting_statistics(self):
+        # setup
+        class BrokenEntropy(Entropy):
+
+            @staticmethod
+            def get_column_scores_from_statistics(statistics):
+                raise NotImplementedError
+
+        msa = MSA(['AA', 'AC', 'AC'])
+
+        # check
+        with self.assertRaises(NotImplementedError):
+            Evaluator([BrokenEntropy]).evaluate(msa)
+
+
+if __name__ == '__main__':
+    unittest.main()
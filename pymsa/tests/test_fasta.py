@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+
+from pymsa.util.fasta import iter_fasta_file, read_fasta_file_as_list_of_pairs, read_fasta_file_as_msa
+
+FASTA = '>seq1 first\nAC-D\nEF\n>seq2\nA--DEF\n\n>seq3\nACGD\n-F\n'
+
+
+class FastaTestCases(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.file_name = tempfile.mkstemp(suffix='.fasta')
+        with os.fdopen(handle, 'w') as file:
+            file.write(FASTA)
+
+    def tearDown(self):
+        os.remove(self.file_name)
+
+    def test_should_iter_fasta_file_yield_records_one_at_a_time(self):
+        # setup
+        records = iter_fasta_file(self.file_name)
+
+        # check
+        self.assertEqual(('seq1 first', 'AC-DEF'), next(records))
+        self.assertEqual(('seq2', 'A--DEF'), next(records))
+        self.assertEqual(('seq3', 'ACGD-F'), next(records))
+        with self.assertRaises(StopIteration):
+            next(records)
+
+    def test_should_read_fasta_file_as_list_of_pairs(self):
+        # results
+        result = read_fasta_file_as_list_of_pairs(self.file_name)
+        expected = [('seq1 first', 'AC-DEF'), ('seq2', 'A--DEF'), ('seq3', 'ACGD-F')]
+
+        # check
+        self.assertEqual(expected, result)
+
+    def test_should_read_fasta_file_as_an_encoded_msa(self):
+        # results
+        msa = read_fasta_file_as_msa(self.file_name)
+
+        # check
+        self.assertEqual(['seq1 first', 'seq2', 'seq3'], msa.ids)
+        self.assertEqual('-ACDEFG', msa.alphabet)
+        self.assertEqual((3, 6), msa.encoded.shape)
+        self.assertEqual(['AC-DEF', 'A--DEF', 'ACGD-F'], msa.sequences)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+
+from pymsa.util.clustal import read_clustal_file_as_msa
+from pymsa.util.fasta import read_a2m_file_as_msa
+from pymsa.util.stockholm import read_stockholm_file_as_msa
+
+STOCKHOLM = '''# STOCKHOLM 1.0
+#=GF ID   Example
+
+seq1/1-6   AC..DE
+seq2/2-7   ACG-DE
+#=GR seq2/2-7 SS  ..HH..
+
+seq1/1-6   F-
+seq2/2-7   FF
+#=GC SS_cons  ..HH....
+//
+seq3       IGNORED
+'''
+
+CLUSTAL = '''CLUSTAL W (1.83) multiple sequence alignment
+
+
+seq1      AC--DE 4
+seq2      ACG-DE 5
+          **  **
+
+seq1      F- 5
+seq2      FF 7
+          *
+'''
+
+A3M = '''#A3M header
+>seq1
+ACdeF-
+>seq2
+A-F
+G
+>seq3
+aaAC..F-
+'''
+
+
+class FormatsTestCases(unittest.TestCase):
+
+    def write(self, content: str) -> str:
+        handle, file_name = tempfile.mkstemp()
+        with os.fdopen(handle, 'w') as file:
+            file.write(content)
+        self.addCleanup(os.remove, file_name)
+
+        return file_name
+
+    def test_should_read_stockholm_file_as_msa(self):
+        # results
+        msa = read_stockholm_file_as_msa(self.write(STOCKHOLM))
+
+        # check
+        self.assertEqual(['seq1/1-6', 'seq2/2-7'], msa.ids)
+        self.assertEqual(['AC--DEF-', 'ACG-DEFF'], msa.sequences)
+
+    def test_should_read_clustal_file_as_msa(self):
+        # results
+        msa = read_clustal_file_as_msa(self.write(CLUSTAL))
+
+        # check
+        self.assertEqual(['seq1', 'seq2'], msa.ids)
+        self.assertEqual(['AC--DEF-', 'ACG-DEFF'], msa.sequences)
+
+    def test_should_read_a3m_file_as_msa_dropping_insert_states(self):
+        # results
+        msa = read_a2m_file_as_msa(self.write(A3M))
+
+        # check
+        self.assertEqual(['seq1', 'seq2', 'seq3'], msa.ids)
+        self.assertEqual(['ACF-', 'A-FG', 'ACF-'], msa.sequences)
+
+
+if __name__ == '__main__':
+    unittest.main()
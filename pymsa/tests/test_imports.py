@@ -0,0 +1,23 @@
+import subprocess
+import sys
+import unittest
+
+
+class ImportTestCases(unittest.TestCase):
+
+    def test_should_not_import_optional_modules_or_build_matrices_on_import(self):
+        # setup
+        code = 'import sys, pymsa, pymsa.core.substitution_matrix as m; ' \
+               'print(sorted(set(sys.modules) & {"urllib.request", "multiprocessing", "subprocess", "zipfile", ' \
+               '"tempfile", "concurrent.futures"})); ' \
+               'print(len(m._shared_instances))'
+
+        # results
+        output = subprocess.check_output([sys.executable, '-c', code]).decode().split()
+
+        # check
+        self.assertEqual(['[]', '0'], output)
+
+
+if __name__ == '__main__':
+    unittest.main()
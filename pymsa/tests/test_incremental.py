@@ -0,0 +1,93 @@
+import unittest
+
+import numpy as np
+
+from pymsa.core.incremental import IncrementalScore
+from pymsa.core.msa import MSA
+from pymsa.core.score import SumOfPairs, Entropy, PercentageOfNonGaps
+from pymsa.core.substitution_matrix import Blosum62
+
+
+class IncrementalScoreTestCases(unittest.TestCase):
+
+    def test_should_compute_return_the_score(self):
+        # setup
+        msa = MSA(['AC-DE', 'ACGDE', 'A-GD-'])
+
+        # results
+        result = IncrementalScore(SumOfPairs(msa, Blosum62())).compute()
+        expected = SumOfPairs(msa, Blosum62()).compute()
+
+        # check
+        self.assertEqual(expected, result)
+
+    def test_should_update_the_score_after_editing_columns_in_place(self):
+        # setup
+        score = IncrementalScore(SumOfPairs(MSA(['AC-DE', 'ACGDE', 'A-GD-']), Blosum62()))
+        msa = MSA(['A-CDE', 'ACGDE', 'AG-D-'])
+
+        # results
+        result = score.update(msa, 1, 3)
+        expected = SumOfPairs(msa, Blosum62()).compute()
+
+        # check
+        self.assertEqual(expected, result)
+
+    def test_should_update_the_score_after_inserting_a_block_of_gaps(self):
+        # setup
+        score = IncrementalScore(Entropy(MSA(['AC-DE', 'ACGDE', 'A-GD-'])))
+        msa = MSA(['AC---DE', 'ACG--DE', 'A-G--D-'])
+
+        # results
+        result = score.update(msa, 3, 5)
+        expected = Entropy(msa).compute()
+
+        # check
+        self.assertAlmostEqual(expected, result)
+        self.assertEqual(len(msa), len(score.column_scores))
+
+    def test_should_update_the_score_after_removing_columns(self):
+        # setup
+        score = IncrementalScore(PercentageOfNonGaps(MSA(['AC---DE', 'ACG--DE', 'A-G--D-'])))
+        msa = MSA(['AC-DE', 'ACGDE', 'A-GD-'])
+
+        # results
+        result = score.update(msa, 3, 3)
+        expected = PercentageOfNonGaps(msa).compute()
+
+        # check
+        self.assertAlmostEqual(expected, result)
+
+    def test_should_update_alignments_of_strings_without_encoding_them(self):
+        # setup
+        score = IncrementalScore(SumOfPairs(MSA(['AC-DE', 'ACGDE', 'A-GD-']), Blosum62()))
+        msa = MSA(['A-CDE', 'ACGDE', 'AG-D-'])
+
+        # results
+        result = score.update(msa, 1, 3)
+        expected = SumOfPairs(MSA(['A-CDE', 'ACGDE', 'AG-D-']), Blosum62()).compute()
+
+        # check
+        self.assertEqual(expected, result)
+        self.assertIsNone(msa._encoded)
+
+    def test_should_update_encoded_alignments_without_decoding_them(self):
+        # setup
+        original = MSA(['AC-DE', 'ACGDE', 'A-GD-'])
+        score = IncrementalScore(SumOfPairs(MSA.from_encoded(original.encoded, original.alphabet), Blosum62()))
+
+        encoded = original.encoded.copy()
+        encoded[:, 1:3] = np.array([[0, 2], [2, 3], [3, 0]])
+        msa = MSA.from_encoded(encoded, original.alphabet)
+
+        # results
+        result = score.update(msa, 1, 3)
+        expected = SumOfPairs(MSA.from_encoded(encoded, original.alphabet), Blosum62()).compute()
+
+        # check
+        self.assertEqual(expected, result)
+        self.assertIsNone(msa._sequences)
+
+
+if __name__ == '__main__':
+    unittest.main()
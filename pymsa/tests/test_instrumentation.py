@@ -0,0 +1,93 @@
+import unittest
+
+from pymsa.core.evaluator import Evaluator
+from pymsa.core.instrumentation import instrument, is_enabled, measure, ACTIVE_METRICS
+from pymsa.core.msa import MSA
+from pymsa.core.score import SumOfPairs, Entropy, Star
+from pymsa.core.substitution_matrix import Blosum62
+
+
+class InstrumentationTestCases(unittest.TestCase):
+
+    def test_should_be_disabled_by_default(self):
+        # check
+        self.assertFalse(is_enabled())
+        self.assertEqual([], ACTIVE_METRICS)
+
+    def test_should_report_the_metrics_of_every_computation_to_the_sink(self):
+        # setup
+        msa = MSA(['AC-', 'CA-', 'AAA'])
+        substitution_matrix = Blosum62()
+        metrics = []
+
+        # results
+        with instrument(metrics.append):
+            SumOfPairs(msa, substitution_matrix).compute()
+            SumOfPairs(msa, substitution_matrix).compute()
+
+        # check
+        self.assertEqual(['SumOfPairs', 'SumOfPairs'], [m.score for m in metrics])
+        self.assertEqual([3, 3], [m.columns for m in metrics])
+        self.assertTrue(all(m.wall_time >= 0 for m in metrics))
+        self.assertEqual(6, metrics[0].substitution_lookups)
+        self.assertEqual((0, 2), (metrics[0].cache_hits, metrics[0].cache_misses))
+        self.assertEqual(0, metrics[1].substitution_lookups)
+        self.assertEqual((2, 0), (metrics[1].cache_hits, metrics[1].cache_misses))
+
+    def test_should_count_the_lookups_of_single_pairs(self):
+        # setup
+        substitution_matrix = Blosum62()
+        metrics = []
+
+        # results
+        with instrument(metrics.append):
+            with measure('pairs', 1):
+                substitution_matrix.get_distance('A', 'C')
+                substitution_matrix.get_distance('A', '-')
+
+        # check
+        self.assertEqual(2, metrics[0].substitution_lookups)
+
+    def test_should_report_every_objective_of_an_evaluator(self):
+        # setup
+        msa = MSA(['AC-', 'CA-', 'AAA'])
+        metrics = []
+
+        # results
+        with instrument(metrics.append):
+            Evaluator([Entropy, (Star, Blosum62())]).evaluate(msa)
+
+        # check
+        self.assertEqual(['Entropy', 'Star'], [m.score for m in metrics])
+
+    def test_should_log_the_metrics_by_default(self):
+        # setup
+        msa = MSA(['AC-', 'CA-', 'AAA'])
+
+        # results
+        with self.assertLogs('pyMSA', level='INFO') as logs:
+            with instrument():
+                Entropy(msa).compute()
+
+        # check
+        self.assertEqual(1, len(logs.output))
+        self.assertIn('Entropy', logs.output[0])
+        self.assertIn('3 columns', logs.output[0])
+
+    def test_should_stop_reporting_after_the_block(self):
+        # setup
+        msa = MSA(['AC-', 'CA-', 'AAA'])
+        metrics = []
+
+        # results
+        with instrument(metrics.append):
+            pass
+        Entropy(msa).compute()
+
+        # check
+        self.assertEqual([], metrics)
+        self.assertFalse(is_enabled())
+
+
+if __name__ == '__main__':
+    unittest.main()
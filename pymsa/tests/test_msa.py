@@ -0,0 +1,152 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from pymsa.core.msa import MSA
+
+
+class MSATestCases(unittest.TestCase):
+
+    def test_should_encode_the_alignment_as_indexes_into_the_alphabet(self):
+        # setup
+        msa = MSA(['AC-', 'CA-'])
+
+        # results
+        alphabet = msa.alphabet
+        encoded = msa.encoded
+
+        # check
+        self.assertEqual('-AC', alphabet)
+        self.assertEqual(np.uint8, encoded.dtype)
+        self.assertEqual([[1, 2, 0], [2, 1, 0]], encoded.tolist())
+
+    def test_should_encoded_matrix_be_cached(self):
+        # setup
+        msa = MSA(['AC-', 'CA-'])
+
+        # check
+        self.assertIs(msa.encoded, msa.encoded)
+
+    def test_should_keep_the_sequences_and_ids(self):
+        # setup
+        msa = MSA(['AC-', 'CA-'], ['a', 'b'])
+
+        # results
+        msa.encoded
+
+        # check
+        self.assertEqual(['AC-', 'CA-'], msa.sequences)
+        self.assertEqual(['a', 'b'], msa.ids)
+
+    def test_should_raise_exception_when_encoding_sequences_with_different_lengths(self):
+        # setup
+        msa = MSA(['AA', 'A', 'AA'])
+
+        # check
+        with self.assertRaises(Exception):
+            msa.encoded
+
+    def test_should_build_an_alignment_from_an_encoded_matrix(self):
+        # setup
+        encoded = np.array([[1, 2, 0], [2, 1, 0]], dtype=np.uint8)
+
+        # results
+        msa = MSA.from_encoded(encoded, '-AC', ['a', 'b'])
+
+        # check
+        self.assertEqual(['AC-', 'CA-'], msa.sequences)
+        self.assertEqual(2, msa.number_of_sequences)
+        self.assertEqual(3, len(msa))
+        self.assertTrue(msa.is_valid)
+
+
+class SaveAndLoadTestCases(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.file_name = tempfile.mkstemp(suffix='.msa')
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.file_name)
+
+    def test_should_load_the_saved_alignment(self):
+        # setup
+        MSA(['AC-DE', 'CA-DE', 'CAGD-'], ['a', 'b', 'c'], gap_character='-').save(self.file_name)
+
+        # results
+        for mmap in (True, False):
+            msa = MSA.load(self.file_name, mmap=mmap)
+
+            # check
+            self.assertEqual(['AC-DE', 'CA-DE', 'CAGD-'], msa.sequences)
+            self.assertEqual(['a', 'b', 'c'], msa.ids)
+            self.assertEqual('-', msa.gap_character)
+            self.assertEqual('-ACDEG', msa.alphabet)
+
+    def test_should_load_memory_map_the_encoded_matrix(self):
+        # setup
+        MSA(['AC-DE', 'CA-DE']).save(self.file_name)
+
+        # results
+        msa = MSA.load(self.file_name)
+
+        # check
+        self.assertIsInstance(msa.encoded, np.memmap)
+        self.assertEqual(0, msa.encoded.offset % 64)
+
+    def test_should_raise_exception_if_the_file_is_not_an_alignment(self):
+        # setup
+        with open(self.file_name, 'w') as file:
+            file.write('>seq\nAC\n')
+
+        # check
+        with self.assertRaises(Exception):
+            MSA.load(self.file_name)
+
+
+class GapMaskTestCases(unittest.TestCase):
+
+    def test_should_gap_mask_hold_a_bit_per_position(self):
+        # setup
+        msa = MSA(['-A--AAAAA-', 'AAAAAAAAAA'])
+
+        # results
+        gap_mask = msa.gap_mask
+
+        # check
+        self.assertEqual(np.uint8, gap_mask.dtype)
+        self.assertEqual((2, 2), gap_mask.shape)
+        self.assertEqual([[0b1101, 0b10], [0, 0]], gap_mask.tolist())
+        self.assertIs(gap_mask, msa.gap_mask)
+
+    def test_should_compute_gap_metrics_from_the_gap_mask(self):
+        # setup
+        msa = MSA(['-A--AAAAA-', '-AA-AAAA--', '-AAAAAAA--'])
+
+        # check
+        self.assertEqual([3, 0, 1, 2, 0, 0, 0, 0, 2, 3], msa.get_gaps_per_column().tolist())
+        self.assertEqual([4, 4, 3], msa.get_gaps_per_sequence().tolist())
+        self.assertEqual([3, 3, 2], msa.get_gap_openings_per_sequence().tolist())
+        self.assertEqual([True] + [False] * 8 + [True], msa.get_gap_only_columns().tolist())
+
+    def test_should_gap_mask_use_the_gap_character_of_the_alignment(self):
+        # setup
+        msa = MSA(['A.-', '..A'], gap_character='.')
+
+        # check
+        self.assertEqual([1, 2, 0], msa.get_gaps_per_column().tolist())
+        self.assertEqual([0, 0], MSA(['AC', 'CA']).get_gaps_per_sequence().tolist())
+
+    def test_should_gap_openings_carry_runs_across_bytes(self):
+        # setup
+        msa = MSA(['AAAAAAA---------AAAA-', 'A' * 21])
+
+        # check
+        self.assertEqual([2, 0], msa.get_gap_openings_per_sequence().tolist())
+        self.assertEqual([10, 0], msa.get_gaps_per_sequence().tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import random
+import unittest
+
+from pymsa.core.msa import MSA
+from pymsa.core.parallel import compute_in_parallel
+from pymsa.core.score import SumOfPairs, Star, Entropy, PercentageOfNonGaps
+from pymsa.core.substitution_matrix import Blosum62
+
+
+class ComputeInParallelTestCases(unittest.TestCase):
+
+    def setUp(self):
+        generator = random.Random(0)
+        self.msa = MSA([''.join(generator.choice('ARNDCQ-') for _ in range(101)) for _ in range(7)])
+
+    def test_should_sum_of_pairs_be_the_same_as_the_sequential_one(self):
+        # setup
+        score = SumOfPairs(self.msa, Blosum62())
+
+        # results
+        result = compute_in_parallel(score, processes=2, chunk_size=10)
+        expected = score.compute()
+
+        # check
+        self.assertEqual(expected, result)
+
+    def test_should_star_be_the_same_as_the_sequential_one(self):
+        # setup
+        score = Star(self.msa, Blosum62())
+
+        # results
+        result = compute_in_parallel(score, processes=2, chunk_size=10)
+        expected = score.compute()
+
+        # check
+        self.assertEqual(expected, result)
+
+    def test_should_entropy_and_percentages_be_the_same_as_the_sequential_ones(self):
+        for score in (Entropy(self.msa), PercentageOfNonGaps(self.msa)):
+            # results
+            result = compute_in_parallel(score, processes=2)
+            expected = score.compute()
+
+            # check
+            self.assertAlmostEqual(expected, result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from urllib.error import HTTPError
+
+from pymsa.util.pdb import PDBFetcher
+
+STRIKE_DIRECTORY = os.path.join(os.path.dirname(__file__), '..', '..', 'examples', 'strike')
+
+
+class PDBFetcherTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.mirror_directory = tempfile.mkdtemp()
+        self.cache_directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.mirror_directory)
+        self.addCleanup(shutil.rmtree, self.cache_directory)
+
+        for pdb_id in ('1d2n', '1e32'):
+            shutil.copy(os.path.join(STRIKE_DIRECTORY, pdb_id + '.pdb'), self.mirror_directory)
+
+        self.fetcher = PDBFetcher(self.cache_directory, Path(self.mirror_directory).as_uri() + '/', retries=0)
+
+    def test_should_fetch_download_the_file_into_the_cache(self):
+        # results
+        path = self.fetcher.fetch('1d2n')
+
+        # check
+        self.assertTrue(path.startswith(self.cache_directory))
+        with open(path, 'rb') as downloaded, open(os.path.join(STRIKE_DIRECTORY, '1d2n.pdb'), 'rb') as original:
+            self.assertEqual(original.read(), downloaded.read())
+
+    def test_should_fetch_reuse_the_cached_file(self):
+        # setup
+        path = self.fetcher.fetch('1d2n')
+        os.remove(os.path.join(self.mirror_directory, '1d2n.pdb'))
+
+        # results
+        result = self.fetcher.fetch('1d2n')
+
+        # check
+        self.assertEqual(path, result)
+
+    def test_should_fetch_all_keep_the_order_of_the_identifiers(self):
+        # results
+        paths = self.fetcher.fetch_all(['1e32', '1d2n'])
+
+        # check
+        self.assertEqual([self.fetcher.fetch('1e32'), self.fetcher.fetch('1d2n')], paths)
+
+    def test_should_fetch_throw_an_exception_if_the_file_is_missing(self):
+        with self.assertRaises(Exception):
+            self.fetcher.fetch('0000')
+
+    def test_should_retry_rate_limited_downloads(self):
+        # setup
+        fetcher = PDBFetcher(self.cache_directory, self.fetcher.base_url, retries=2, backoff=0)
+        urlopen = mock.MagicMock(side_effect=[HTTPError('url', 429, 'Too Many Requests', None, None),
+                                              HTTPError('url', 408, 'Request Timeout', None, None),
+                                              open(os.path.join(STRIKE_DIRECTORY, '1d2n.pdb'), 'rb')])
+
+        # results
+        with mock.patch('urllib.request.urlopen', urlopen):
+            path = fetcher.fetch('1d2n')
+
+        # check
+        self.assertEqual(3, urlopen.call_count)
+        self.assertTrue(os.path.isfile(path))
+
+    def test_should_not_retry_other_client_errors(self):
+        # setup
+        fetcher = PDBFetcher(self.cache_directory, self.fetcher.base_url, retries=2, backoff=0)
+        urlopen = mock.MagicMock(side_effect=HTTPError('url', 403, 'Forbidden', None, None))
+
+        # results
+        with mock.patch('urllib.request.urlopen', urlopen), self.assertRaises(Exception):
+            fetcher.fetch('1d2n')
+
+        # check
+        self.assertEqual(1, urlopen.call_count)
+
+    def test_should_read_the_cache_directory_from_the_environment_when_built(self):
+        # results
+        with mock.patch.dict(os.environ, {'PYMSA_PDB_CACHE': self.cache_directory}):
+            fetcher = PDBFetcher()
+
+        # check
+        self.assertEqual(os.path.abspath(self.cache_directory), fetcher.cache_directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
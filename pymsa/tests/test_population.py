@@ -0,0 +1,75 @@
+import random
+import unittest
+
+from pymsa.core.msa import MSA
+from pymsa.core.population import score_population
+from pymsa.core.score import Score, SumOfPairs, AffineSumOfPairs, Star, Entropy, PercentageOfNonGaps, \
+    PercentageOfTotallyConservedColumns
+from pymsa.core.substitution_matrix import PAM250, Blosum62
+
+
+class NumberOfGaps(Score):
+
+    def get_column_score(self, k: int) -> float:
+        return self.get_column(k).count('-')
+
+    @staticmethod
+    def is_minimization() -> bool:
+        return True
+
+
+def random_population(size: int, seed: int = 0) -> list:
+    generator = random.Random(seed)
+    population = []
+
+    for _ in range(size):
+        length = generator.choice([10, 12])
+        population.append(MSA([''.join(generator.choice('ACDEFG-') for _ in range(length)) for _ in range(5)]))
+
+    return population
+
+
+class ScorePopulationTestCases(unittest.TestCase):
+
+    def test_should_return_one_row_per_objective_and_one_column_per_alignment(self):
+        # setup
+        population = random_population(6)
+
+        # results
+        result = score_population(population, [Entropy, (SumOfPairs, PAM250())])
+
+        # check
+        self.assertEqual((2, 6), result.shape)
+
+    def test_should_scores_match_the_scores_of_every_alignment(self):
+        # setup
+        population = random_population(8)
+        objectives = [(SumOfPairs, Blosum62()), (Star, PAM250()), Entropy, PercentageOfNonGaps,
+                      PercentageOfTotallyConservedColumns, NumberOfGaps]
+
+        # results
+        result = score_population(population, objectives)
+
+        # check
+        for i, msa in enumerate(population):
+            self.assertEqual(SumOfPairs(msa, Blosum62()).compute(), result[0, i])
+            self.assertEqual(Star(msa, PAM250()).compute(), result[1, i])
+            self.assertAlmostEqual(Entropy(msa).compute(), result[2, i])
+            self.assertAlmostEqual(PercentageOfNonGaps(msa).compute(), result[3, i])
+            self.assertAlmostEqual(PercentageOfTotallyConservedColumns(msa).compute(), result[4, i])
+            self.assertEqual(sum(seq.count('-') for seq in msa.sequences), result[5, i])
+
+    def test_should_scores_that_need_the_whole_alignment_be_computed_per_alignment(self):
+        # setup
+        population = random_population(4)
+
+        # results
+        result = score_population(population, [(AffineSumOfPairs, PAM250(), -10, -1)])
+
+        # check
+        for i, msa in enumerate(population):
+            self.assertEqual(AffineSumOfPairs(msa, PAM250(), -10, -1).compute(), result[0, i])
+
+
+if __name__ == '__main__':
+    unittest.main()
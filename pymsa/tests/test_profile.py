@@ -0,0 +1,85 @@
+import unittest
+
+import numpy as np
+
+from pymsa.core.msa import MSA
+from pymsa.core.profile import ScoreProfile
+from pymsa.core.score import SumOfPairs, Entropy, PercentageOfNonGaps
+from pymsa.core.substitution_matrix import Blosum62
+
+
+class ScoreProfileTestCases(unittest.TestCase):
+
+    def test_should_get_profile_contain_the_score_of_every_column(self):
+        # setup
+        msa = MSA(['A-TGCAAT-G', '-CT-CCAT-A', '-TTAT-CTG-'])
+        score = SumOfPairs(msa, Blosum62())
+
+        # results
+        profile = score.get_profile()
+
+        # check
+        self.assertEqual(len(msa), len(profile))
+        self.assertEqual([score.get_column_score(k) for k in range(len(msa))], profile.column_scores.tolist())
+        self.assertEqual(score.compute(), profile.get_window_score(0, len(msa)))
+
+    def test_should_get_window_score_sum_the_columns_of_the_window(self):
+        # setup
+        profile = ScoreProfile(np.array([3, -1, 4, -1, 5]))
+
+        # check
+        self.assertEqual(3, profile.get_window_score(1, 3))
+        self.assertEqual(0, profile.get_window_score(2, 2))
+        self.assertEqual(10, profile.get_window_score(0, 5))
+
+    def test_should_get_window_scores_return_every_window(self):
+        # setup
+        profile = ScoreProfile(np.array([3, -1, 4, -1, 5]))
+
+        # check
+        self.assertEqual([6, 2, 8], profile.get_window_scores(3).tolist())
+        self.assertEqual([6, 8], profile.get_window_scores(3, step=2).tolist())
+        self.assertEqual([10], profile.get_window_scores(5).tolist())
+
+    def test_should_window_scores_of_float_scores_be_floats(self):
+        # setup
+        msa = MSA(['A-TGCAAT-G', '-CT-CCAT-A', '-TTAT-CTG-'])
+        profile = Entropy(msa).get_profile()
+
+        # results
+        window_scores = profile.get_window_scores(4)
+
+        # check
+        self.assertEqual(np.float64, window_scores.dtype)
+        self.assertAlmostEqual(profile.column_scores[2:6].sum(), window_scores[2])
+
+    def test_should_get_worst_windows_return_non_overlapping_windows(self):
+        # setup
+        profile = ScoreProfile(np.array([5, -3, -4, 5, 5, -2, -2, 5]))
+
+        # check
+        self.assertEqual([1, 5], profile.get_worst_windows(2, number=2))
+        self.assertEqual([1, 5, 3], profile.get_worst_windows(2, number=3))
+
+    def test_should_get_worst_windows_prefer_high_scores_if_minimizing(self):
+        # setup
+        msa = MSA(['AAAA--AA', 'AAAA--A-', 'AAAAAAAA'])
+        profile = PercentageOfNonGaps(msa).get_profile()
+
+        # check
+        self.assertTrue(profile.minimization)
+        self.assertEqual([4], profile.get_worst_windows(2))
+
+    def test_should_throw_an_exception_if_the_window_is_not_valid(self):
+        # setup
+        profile = ScoreProfile(np.array([1, 2, 3]))
+
+        # check
+        with self.assertRaises(AssertionError):
+            profile.get_window_score(2, 1)
+        with self.assertRaises(AssertionError):
+            profile.get_window_scores(4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,18 @@
+import itertools
+import os
+import random
 import unittest
 
+from pymsa.core.blocks import ColumnBlocks
+from pymsa.core.evaluator import Evaluator
+from pymsa.core.incremental import IncrementalScore
 from pymsa.core.msa import MSA
-from pymsa.core.substitution_matrix import PAM250, Blosum62
-from pymsa.core.score import Score, SumOfPairs, Star, Entropy, PercentageOfTotallyConservedColumns, PercentageOfNonGaps
+from pymsa.core.parallel import compute_in_parallel
+from pymsa.core.substitution_matrix import PAM250, Blosum62, FileMatrix
+from pymsa.core.score import Score, SumOfPairs, WeightedSumOfPairs, AffineSumOfPairs, Star, Entropy, \
+    PercentageOfTotallyConservedColumns, PercentageOfNonGaps
+
+MATRIX_FILE = os.path.join(os.path.dirname(__file__), '..', '..', 'examples', 'PAM380.txt')
 
 
 class ScoreTestCases(unittest.TestCase):
@@ -24,8 +34,37 @@ class ScoreTestCases(unittest.TestCase):
             Score(sequence)
 
 
+def random_alignment(number_of_sequences: int, length: int, alphabet: str = 'ARNDCQEGHILKMFPSTWYV-',
+                     seed: int = 0) -> MSA:
+    generator = random.Random(seed)
+    return MSA([''.join(generator.choice(alphabet) for _ in range(length)) for _ in range(number_of_sequences)])
+
+
+def leave_one_out(score_class, msa: MSA, *args) -> list:
+    def column_by_column(sequences):
+        score = score_class(MSA(sequences), *args)
+        return sum(score.get_column_score(k) for k in range(len(score.msa)))
+
+    final_score = column_by_column(msa.sequences)
+
+    return [final_score - column_by_column(msa.sequences[:i] + msa.sequences[i + 1:])
+            for i in range(msa.number_of_sequences)]
+
+
 class SumOfPairsTestCases(unittest.TestCase):
 
+    def test_count_based_score_should_match_the_score_of_every_pair_of_chars(self):
+        # setup
+        sequences = random_alignment(12, 40)
+        score = SumOfPairs(sequences, Blosum62())
+
+        # results
+        result = score.get_column_scores().tolist()
+        expected = [score.get_column_score(k) for k in range(len(sequences))]
+
+        # check
+        self.assertEqual(expected, result)
+
     def test_basic_score_of_12_with_PAM250(self):
         # setup
         sequences = MSA(['AA', 'AA', 'AA'])
@@ -96,6 +135,175 @@ class SumOfPairsTestCases(unittest.TestCase):
         # check
         self.assertEqual(expected, result)
 
+    def test_should_score_the_last_character_of_a_file_matrix(self):
+        # setup
+        sequences = MSA(['AAA*', 'AAAC', 'AAAC'])
+
+        # results
+        result = SumOfPairs(sequences, FileMatrix(MATRIX_FILE)).compute()
+        expected = 8
+
+        # check
+        self.assertEqual(expected, result)
+
+    def test_should_sequence_contributions_match_the_scores_without_every_sequence(self):
+        for seed in range(5):
+            # setup
+            sequences = random_alignment(6, 30, 'ARNDC-', seed=seed)
+
+            # results
+            result = SumOfPairs(sequences, Blosum62()).get_sequence_contributions().tolist()
+            expected = leave_one_out(SumOfPairs, sequences, Blosum62())
+
+            # check
+            self.assertEqual(expected, result)
+
+
+class WeightedSumOfPairsTestCases(unittest.TestCase):
+
+    def test_should_be_the_sum_of_pairs_if_weights_are_equal(self):
+        # setup
+        sequences = MSA(['AC-', 'CA-'])
+
+        # results
+        result = WeightedSumOfPairs(sequences, Blosum62()).compute()
+        expected = SumOfPairs(sequences, Blosum62()).compute()
+
+        # check
+        self.assertEqual(expected, result)
+
+    def test_should_count_based_score_match_the_score_of_every_pair_of_chars(self):
+        for weighting in ('henikoff', 'clustering'):
+            # setup
+            sequences = random_alignment(10, 30, 'ARND-', seed=1)
+            score = WeightedSumOfPairs(sequences, PAM250(), weighting, 0.3)
+
+            # results
+            result = score.get_column_scores().tolist()
+            expected = [score.get_column_score(k) for k in range(len(sequences))]
+
+            # check
+            for expected_value, value in zip(expected, result):
+                self.assertAlmostEqual(expected_value, value)
+
+    def test_should_compute_henikoff_weights(self):
+        # setup
+        sequences = MSA(['AA', 'AA', 'CC'])
+
+        # results
+        result = sequences.get_sequence_weights('henikoff').tolist()
+
+        # check
+        self.assertEqual([0.75, 0.75, 1.5], result)
+
+    def test_should_compute_clustering_weights(self):
+        # setup
+        sequences = MSA(['AAAA', 'AAA-', 'CCCC'])
+
+        # results
+        result = sequences.get_sequence_weights('clustering', 0.62).tolist()
+
+        # check
+        self.assertEqual([0.75, 0.75, 1.5], result)
+
+    def test_should_weights_be_cached(self):
+        # setup
+        sequences = MSA(['AA', 'AA', 'CC'])
+
+        # check
+        self.assertIs(sequences.get_sequence_weights(), sequences.get_sequence_weights())
+
+    def test_should_sequence_contributions_score_the_alignment_without_every_sequence(self):
+        # setup
+        sequences = random_alignment(5, 20, 'ARN-', seed=1)
+        score = WeightedSumOfPairs(sequences, Blosum62())
+
+        # results
+        result = score.get_sequence_contributions().tolist()
+        expected = [score.compute() - WeightedSumOfPairs(MSA(sequences.sequences[:i] + sequences.sequences[i + 1:]),
+                                                         Blosum62()).compute() for i in range(5)]
+
+        # check
+        for expected_contribution, contribution in zip(expected, result):
+            self.assertAlmostEqual(expected_contribution, contribution)
+
+    def test_should_chunked_computations_refuse_the_score(self):
+        # setup
+        sequences = random_alignment(6, 40, seed=2)
+        score = WeightedSumOfPairs(sequences, Blosum62())
+
+        # check
+        self.assertFalse(WeightedSumOfPairs.is_column_separable())
+        with self.assertRaises(Exception):
+            Evaluator([WeightedSumOfPairs]).evaluate_blocks(ColumnBlocks(sequences.encoded, sequences.alphabet,
+                                                                         block_size=8))
+        with self.assertRaises(Exception):
+            compute_in_parallel(score, processes=2, chunk_size=8)
+        with self.assertRaises(Exception):
+            IncrementalScore(score)
+
+
+def affine_sum_of_pairs(sequences: list, substitution_matrix, gap_open: int, gap_extend: int) -> int:
+    score = 0
+
+    for seq_a, seq_b in itertools.combinations(sequences, 2):
+        pairs = [(char_a, char_b) for char_a, char_b in zip(seq_a, seq_b) if char_a != '-' or char_b != '-']
+        previous = None
+
+        for char_a, char_b in pairs:
+            if char_a == '-' or char_b == '-':
+                score += gap_extend
+                current = 'a' if char_a == '-' else 'b'
+                if current != previous:
+                    score += gap_open
+                previous = current
+            else:
+                score += substitution_matrix.get_distance(char_a, char_b)
+                previous = None
+
+    return score
+
+
+class AffineSumOfPairsTestCases(unittest.TestCase):
+
+    def test_should_open_one_gap_per_run(self):
+        # setup
+        sequences = MSA(['A--A', 'AAAA'])
+
+        # results
+        result = AffineSumOfPairs(sequences, PAM250(), -10, -1).compute()
+        expected = 2 + 2 - 10 - 1 - 1
+
+        # check
+        self.assertEqual(expected, result)
+
+    def test_should_not_open_gaps_covered_by_gaps_of_the_other_sequence(self):
+        # setup
+        sequences = MSA(['A--A', 'A--A', 'A-AA'])
+
+        # results
+        result = AffineSumOfPairs(sequences, PAM250(), -10, -1).compute()
+        expected = affine_sum_of_pairs(sequences.sequences, PAM250(), -10, -1)
+
+        # check
+        self.assertEqual(expected, result)
+
+    def test_should_match_the_score_of_every_pairwise_alignment(self):
+        for seed in range(5):
+            # setup
+            sequences = random_alignment(8, 40, 'ARN---', seed=seed)
+
+            # results
+            result = AffineSumOfPairs(sequences, Blosum62(), -11, -2).compute()
+            expected = affine_sum_of_pairs(sequences.sequences, Blosum62(), -11, -2)
+
+            # check
+            self.assertEqual(expected, result)
+
+    def test_should_not_be_column_separable(self):
+        self.assertFalse(AffineSumOfPairs.is_column_separable())
+        self.assertTrue(SumOfPairs.is_column_separable())
+
 
 class StarTestCases(unittest.TestCase):
 
@@ -143,6 +351,42 @@ class StarTestCases(unittest.TestCase):
         # check
         self.assertEqual(expected, result)
 
+    def test_vectorized_score_should_match_the_score_of_every_column(self):
+        # setup
+        sequences = random_alignment(9, 60, 'ACGT-')
+        score = Star(sequences, Blosum62())
+
+        # results
+        result = score.get_column_scores().tolist()
+        expected = [score.get_column_score(k) for k in range(len(sequences))]
+
+        # check
+        self.assertEqual(expected, result)
+
+    def test_should_score_the_last_character_of_a_file_matrix(self):
+        # setup
+        sequences = MSA(['AAA*', 'AAAC', 'AAAC'])
+
+        # results
+        result = Star(sequences, FileMatrix(MATRIX_FILE)).compute()
+        expected = 34
+
+        # check
+        self.assertEqual(expected, result)
+
+    def test_should_sequence_contributions_match_the_scores_without_every_sequence(self):
+        # many ties, so removing a sequence often changes the consensus
+        for seed in range(10):
+            # setup
+            sequences = random_alignment(5, 30, 'AC-', seed=seed)
+
+            # results
+            result = Star(sequences, PAM250()).get_sequence_contributions().tolist()
+            expected = leave_one_out(Star, sequences, PAM250())
+
+            # check
+            self.assertEqual(expected, result)
+
 
 class EntropyTestCases(unittest.TestCase):
 
@@ -213,6 +457,19 @@ class EntropyTestCases(unittest.TestCase):
         # check
         self.assertEqual(expected, result)
 
+    def test_vectorized_score_should_match_the_score_of_every_column(self):
+        # setup
+        sequences = random_alignment(15, 40, 'ACGT-')
+        score = Entropy(sequences)
+
+        # results
+        result = score.get_column_scores().tolist()
+        expected = [score.get_column_score(k) for k in range(len(sequences))]
+
+        # check
+        for expected_value, value in zip(expected, result):
+            self.assertAlmostEqual(expected_value, value)
+
     def test_compute_of_two_gapped_seqs(self):
         # setup
         sequences = MSA(["-----", "-----"])
@@ -224,6 +481,19 @@ class EntropyTestCases(unittest.TestCase):
         # check
         self.assertEqual(expected, result)
 
+    def test_should_sequence_contributions_match_the_scores_without_every_sequence(self):
+        for seed in range(5):
+            # setup
+            sequences = random_alignment(6, 30, 'ACGT-', seed=seed)
+
+            # results
+            result = Entropy(sequences).get_sequence_contributions().tolist()
+            expected = leave_one_out(Entropy, sequences)
+
+            # check
+            for expected_contribution, contribution in zip(expected, result):
+                self.assertAlmostEqual(expected_contribution, contribution)
+
 
 class PercentageOfTotallyConservedColumnsTestCases(unittest.TestCase):
 
@@ -296,6 +566,30 @@ class PercentageOfNonGapsTestCases(unittest.TestCase):
         # check
         self.assertEqual(result, expected)
 
+    def test_percentage_of_non_gaps_with_another_gap_character(self):
+        # setup
+        sequences = MSA(["A.-", "A..", "AC-"], gap_character='.')
+
+        # results
+        result = PercentageOfNonGaps(sequences).compute()
+        expected = 100 - 3 / 9 * 100
+
+        # check
+        self.assertAlmostEqual(expected, result)
+
+    def test_vectorized_score_should_match_the_score_of_every_column(self):
+        # setup
+        sequences = random_alignment(9, 60, 'AC--')
+        score = PercentageOfNonGaps(sequences)
+
+        # results
+        result = score.get_column_scores().tolist()
+        expected = [score.get_column(k).count('-') for k in range(len(sequences))]
+
+        # check
+        self.assertEqual(expected, result)
+        self.assertEqual(expected, [score.get_column_score(k) for k in range(len(sequences))])
+
 
 if __name__ == "__main__":
     unittest.main()
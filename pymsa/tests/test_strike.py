@@ -0,0 +1,73 @@
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from pymsa.core.score import Strike
+from pymsa.util.pdb import PDBFetcher
+
+STRIKE_DIRECTORY = os.path.join(os.path.dirname(__file__), '..', '..', 'examples', 'strike')
+
+FAKE_STRIKE = '''#!/bin/sh
+# prints the number of gaps of the alignment, and records the work directory
+dirname "$4" >> "$(dirname "$0")/work_directories"
+echo "STRIKE score"
+tr -cd '-' < "$4" | wc -c
+'''
+
+
+class StrikeTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+        self.exe_path = os.path.join(self.directory, 'strike')
+        with open(self.exe_path, 'w') as exe:
+            exe.write(FAKE_STRIKE)
+        os.chmod(self.exe_path, os.stat(self.exe_path).st_mode | stat.S_IEXEC)
+
+        path = os.environ['PATH']
+        os.environ['PATH'] = self.directory + os.pathsep + path
+        self.addCleanup(os.environ.__setitem__, 'PATH', path)
+
+        mirror_url = Path(STRIKE_DIRECTORY).resolve().as_uri() + '/'
+        self.fetcher = PDBFetcher(os.path.join(self.directory, 'cache'), mirror_url)
+        self.sequences_id = ['1d2n', '1e32']
+        self.chains = ['A', 'A']
+
+    def get_work_directories(self) -> list:
+        with open(os.path.join(self.directory, 'work_directories')) as file:
+            return file.read().split()
+
+    def test_should_evaluate_run_strike_in_a_temporary_work_directory(self):
+        # setup
+        strike = Strike(['AC-D', 'A--D'], self.exe_path, self.fetcher)
+
+        # results
+        result = strike.evaluate(self.sequences_id, self.chains)
+
+        # check
+        self.assertEqual(3.0, result)
+        self.assertFalse(os.path.exists(self.get_work_directories()[0]))
+
+    def test_should_evaluate_population_score_every_alignment_in_its_own_work_directory(self):
+        # setup
+        population = [['AC-D', 'A--D'], ['ACGD', 'A-CD'], ['-C-D', 'A---']]
+
+        # results
+        with mock.patch.object(self.fetcher, 'fetch_all', wraps=self.fetcher.fetch_all) as fetch_all:
+            result = Strike.evaluate_population(population, self.sequences_id, self.chains, self.exe_path, 2,
+                                                self.fetcher)
+
+        # check
+        self.assertEqual([3.0, 1.0, 5.0], result)
+        self.assertEqual(3, len(set(self.get_work_directories())))
+        self.assertEqual(1, fetch_all.call_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
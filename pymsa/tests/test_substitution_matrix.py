@@ -1,5 +1,11 @@
 import unittest
 import os
+import pickle
+import shutil
+import tempfile
+from unittest import mock
+
+import numpy as np
 
 from pymsa.core.substitution_matrix import SubstitutionMatrix, FileMatrix, PAM250, Blosum62
 
@@ -27,6 +33,56 @@ class SubstitutionMatrixTestCases(unittest.TestCase):
 
         self.assertEqual(1, matrix.get_distance('-', '-'))
 
+    def test_should_compile_a_symmetric_table_indexed_by_encoded_residue(self):
+        matrix = PAM250()
+
+        table = matrix.compile('-AR')
+
+        self.assertEqual([[1, -8, -8], [-8, 2, -2], [-8, -2, 6]], table.tolist())
+        self.assertTrue(np.array_equal(table, table.T))
+
+    def test_should_compile_cache_the_table_of_an_alphabet(self):
+        matrix = Blosum62()
+
+        self.assertIs(matrix.compile('-AR'), matrix.compile('-AR'))
+
+    def test_should_compile_throw_an_exception_if_a_char_is_invalid(self):
+        matrix = PAM250()
+
+        with self.assertRaises(Exception):
+            matrix.compile('AJ')
+
+
+class SharedMatrixTestCases(unittest.TestCase):
+
+    def test_should_shared_return_always_the_same_instance(self):
+        self.assertIs(PAM250.shared(), PAM250.shared())
+        self.assertIs(Blosum62.shared(), Blosum62.shared())
+        self.assertIsInstance(Blosum62.shared(), Blosum62)
+
+    def test_should_shared_instance_have_the_default_values(self):
+        matrix = PAM250.shared()
+
+        self.assertEqual(-8, matrix.gap_penalty)
+        self.assertEqual(PAM250().get_distance('W', 'F'), matrix.get_distance('W', 'F'))
+
+    def test_should_shared_instance_be_immutable(self):
+        matrix = PAM250.shared()
+
+        with self.assertRaises(Exception):
+            matrix.gap_penalty = -4
+        with self.assertRaises(TypeError):
+            matrix.distance_matrix[('W', 'F')] = 100
+
+    def test_should_shared_instance_be_unpickled_as_the_shared_instance(self):
+        self.assertIs(PAM250.shared(), pickle.loads(pickle.dumps(PAM250.shared())))
+
+    def test_should_other_instances_remain_mutable(self):
+        matrix = PAM250()
+        matrix.gap_penalty = -4
+
+        self.assertEqual(-4, pickle.loads(pickle.dumps(matrix)).gap_penalty)
+
 
 class FileMatrixTestCases(unittest.TestCase):
 
@@ -45,6 +101,86 @@ class FileMatrixTestCases(unittest.TestCase):
         self.assertEqual(+4, matrix.get_distance('I', 'I'))
         self.assertEqual(+4, matrix.get_distance('V', 'V'))
 
+    def test_should_compile_agree_with_get_distance(self):
+        matrix = FileMatrix(path=os.path.dirname(__file__) + '/test_matrix.txt')
+
+        table = matrix.compile('-ARX')
+
+        for i, char1 in enumerate('-ARX'):
+            for j, char2 in enumerate('-ARX'):
+                self.assertEqual(matrix.get_distance(char1, char2), table[i, j])
+
+    def test_should_read_the_last_column_of_the_file(self):
+        matrix = FileMatrix(path=os.path.dirname(__file__) + '/test_matrix.txt')
+
+        self.assertEqual(1, matrix.get_distance('*', '*'))
+        self.assertEqual(-9, matrix.get_distance('A', '*'))
+
+    def test_should_not_read_the_file_again_if_it_has_not_changed(self):
+        path = os.path.dirname(__file__) + '/test_matrix.txt'
+        FileMatrix(path)
+
+        with mock.patch.object(FileMatrix, 'read_matrix_from_file') as read_matrix_from_file:
+            matrix = FileMatrix(path)
+
+        read_matrix_from_file.assert_not_called()
+        self.assertEqual(-1, matrix.get_distance('A', 'R'))
+
+    def test_should_read_the_file_again_if_it_has_changed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'matrix.txt')
+            shutil.copy(os.path.dirname(__file__) + '/test_matrix.txt', path)
+            FileMatrix(path)
+
+            with open(path, 'a') as file:
+                file.write('# comment\n')
+
+            with mock.patch.object(FileMatrix, 'read_matrix_from_file', return_value={}) as read_matrix_from_file:
+                FileMatrix(path)
+
+            read_matrix_from_file.assert_called_once_with(path)
+
+    def test_should_instances_not_share_the_cached_matrix(self):
+        path = os.path.dirname(__file__) + '/test_matrix.txt'
+
+        FileMatrix(path).distance_matrix[('A', 'R')] = 100
+
+        self.assertEqual(-1, FileMatrix(path).get_distance('A', 'R'))
+
+    def test_should_load_the_matrix_from_the_binary_cache_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'matrix.txt')
+            shutil.copy(os.path.dirname(__file__) + '/test_matrix.txt', path)
+            expected = FileMatrix(path, binary_cache=True).distance_matrix
+
+            self.assertTrue(os.path.isfile(path + '.npz'))
+
+            # simulate a new process
+            with mock.patch.dict('pymsa.core.substitution_matrix._file_matrix_cache', clear=True), \
+                    mock.patch.object(FileMatrix, 'read_matrix_from_file') as read_matrix_from_file:
+                matrix = FileMatrix(path, binary_cache=True)
+
+            read_matrix_from_file.assert_not_called()
+            self.assertEqual(expected, matrix.distance_matrix)
+
+    def test_should_ignore_a_corrupt_binary_cache_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'matrix.txt')
+            shutil.copy(os.path.dirname(__file__) + '/test_matrix.txt', path)
+
+            with open(path + '.npz', 'wb') as file:
+                file.write(b'not a cache')
+
+            matrix = FileMatrix(path, binary_cache=True)
+
+            self.assertEqual(-1, matrix.get_distance('A', 'R'))
+            self.assertIsNotNone(FileMatrix.read_binary_cache(path + '.npz', (os.stat(path).st_mtime_ns,
+                                                                               os.stat(path).st_size)))
+
+    def test_should_throw_an_exception_if_the_file_does_not_exist(self):
+        with self.assertRaises(Exception):
+            FileMatrix('/nonexistent/matrix.txt')
+
 
 class PAM250TestCases(unittest.TestCase):
 
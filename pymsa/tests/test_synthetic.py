@@ -0,0 +1,47 @@
+import unittest
+
+from pymsa.util.synthetic import generate_alignment, DNA
+
+
+class SyntheticAlignmentTestCases(unittest.TestCase):
+
+    def test_should_generate_an_alignment_of_the_given_size(self):
+        # setup
+        msa = generate_alignment(5, 20)
+
+        # check
+        self.assertEqual(5, msa.number_of_sequences)
+        self.assertEqual(20, len(msa))
+        self.assertTrue(msa.is_valid)
+
+    def test_should_generate_the_same_alignment_with_the_same_seed(self):
+        # setup
+        msa_1 = generate_alignment(10, 50, seed=3)
+        msa_2 = generate_alignment(10, 50, seed=3)
+        msa_3 = generate_alignment(10, 50, seed=4)
+
+        # check
+        self.assertEqual(msa_1.sequences, msa_2.sequences)
+        self.assertNotEqual(msa_1.sequences, msa_3.sequences)
+
+    def test_should_use_the_given_alphabet_and_gap_density(self):
+        # setup
+        msa = generate_alignment(100, 100, gap_density=0.3, alphabet=DNA, gap_character='.')
+
+        # results
+        characters = ''.join(msa.sequences)
+
+        # check
+        self.assertLessEqual(set(characters), set(DNA + '.'))
+        self.assertAlmostEqual(0.3, characters.count('.') / len(characters), delta=0.02)
+
+    def test_should_generate_alignments_without_gaps(self):
+        # setup
+        msa = generate_alignment(10, 10, gap_density=0)
+
+        # check
+        self.assertNotIn('-', ''.join(msa.sequences))
+
+
+if __name__ == '__main__':
+    unittest.main()
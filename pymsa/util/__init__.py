@@ -1,7 +1,12 @@
-from .fasta import read_fasta_file_as_list_of_pairs
+from .fasta import iter_fasta_file, read_fasta_file_as_list_of_pairs, read_fasta_file_as_msa, read_a2m_file_as_msa
+from .stockholm import read_stockholm_file_as_msa
+from .clustal import read_clustal_file_as_msa
 from .tool import Tool, StrikeEx
+from .pdb import PDBFetcher
+from .synthetic import generate_alignment
 
 __all__ = [
-    'read_fasta_file_as_list_of_pairs',
-    'Tool', 'StrikeEx'
+    'iter_fasta_file', 'read_fasta_file_as_list_of_pairs', 'read_fasta_file_as_msa', 'read_a2m_file_as_msa',
+    'read_stockholm_file_as_msa', 'read_clustal_file_as_msa',
+    'Tool', 'StrikeEx', 'PDBFetcher', 'generate_alignment'
 ]
@@ -0,0 +1,25 @@
+from pymsa.core.msa import MSA, encode_rows
+
+
+def read_clustal_file_as_msa(file_name: str, gap_character: str = '-') -> MSA:
+    """
+    Read a file in Clustal format as an encoded alignment. The header, the conservation lines and the optional
+    residue counts at the end of each line are skipped.
+
+    :param file_name: Clustal file.
+    :param gap_character: Gap character of the alignment.
+    :return: Alignment.
+    """
+    rows = {}
+
+    with open(file_name, 'rb') as file:
+        file.readline()
+
+        for line in file:
+            if line[:1].isspace() or not line.strip():
+                continue
+
+            key, fragment = line.split()[:2]
+            rows.setdefault(key.decode(), bytearray()).extend(fragment)
+
+    return MSA.from_encoded(*encode_rows(list(rows.values())), list(rows.keys()), gap_character)
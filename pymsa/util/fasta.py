@@ -1,29 +1,105 @@
-from pymsa.core.msa import MSA
+from typing import Iterator, Tuple
 
+from pymsa.core.msa import MSA, encode_rows
 
-def read_fasta_file_as_list_of_pairs(file_name: str) -> list:
+INSERT_STATES = b'.abcdefghijklmnopqrstuvwxyz'
+
+
+def iter_fasta_file(file_name: str) -> Iterator[Tuple[str, str]]:
     """
-    Read a file in FASTA format as list of pairs (sequence id, sequence).
+    Read a file in FASTA format one record at a time.
 
     :param file_name: FASTA file.
-    :return: List of pairs.
+    :return: Generator of pairs (sequence id, sequence).
     """
-    list_of_pairs = []
-    key = ''
-    value = ''
+    key = None
+    fragments = []
 
     with open(file_name, 'r') as file:
         for line in file:
             if line[0] == '>':
-                if key != '':
-                    list_of_pairs.append((key, value))
+                if key is not None:
+                    yield key, ''.join(fragments)
                 key = line[1:].rstrip()
-                value = ''
+                fragments = []
             else:
-                value += line.rstrip()
+                fragments.append(line.rstrip())
+
+    if key is not None:
+        yield key, ''.join(fragments)
+
+
+def read_fasta_file_as_list_of_pairs(file_name: str) -> list:
+    """
+    Read a file in FASTA format as list of pairs (sequence id, sequence).
+
+    :param file_name: FASTA file.
+    :return: List of pairs.
+    """
+    return list(iter_fasta_file(file_name))
+
+
+def iter_fasta_file_as_bytes(file_name: str, delete: bytes = b'') -> Iterator[Tuple[str, bytearray]]:
+    """
+    Read a file in FASTA format one record at a time, without decoding the sequences.
+
+    :param file_name: FASTA file.
+    :param delete: Characters to remove from the sequences while they are read.
+    :return: Generator of pairs (sequence id, sequence as bytes).
+    """
+    key = None
+    row = bytearray()
+
+    with open(file_name, 'rb') as file:
+        for line in file:
+            if line[:1] == b'>':
+                if key is not None:
+                    yield key, row
+                key = line[1:].rstrip().decode()
+                row = bytearray()
+            else:
+                row += line.rstrip().translate(None, delete)
+
+    if key is not None:
+        yield key, row
+
+
+def read_fasta_file_as_msa(file_name: str, gap_character: str = '-') -> MSA:
+    """
+    Read an aligned file in FASTA format straight into an encoded alignment (see :meth:`MSA.from_encoded`), so
+    sequences are never held as Python strings.
+
+    :param file_name: FASTA file.
+    :param gap_character: Gap character of the alignment.
+    :return: Alignment.
+    """
+    ids = []
+    rows = []
+
+    for key, row in iter_fasta_file_as_bytes(file_name):
+        ids.append(key)
+        rows.append(row)
+
+    return MSA.from_encoded(*encode_rows(rows), ids, gap_character)
+
+
+def read_a2m_file_as_msa(file_name: str, gap_character: str = '-') -> MSA:
+    """
+    Read a file in A2M or A3M format as an encoded alignment. Insert states (lowercase residues and '.') are
+    dropped while the file is read, so only match columns are kept.
+
+    :param file_name: A2M or A3M file.
+    :param gap_character: Gap character of the alignment.
+    :return: Alignment.
+    """
+    ids = []
+    rows = []
+
+    for key, row in iter_fasta_file_as_bytes(file_name, delete=INSERT_STATES):
+        ids.append(key)
+        rows.append(row)
 
-    list_of_pairs.append((key, value))
-    return list_of_pairs
+    return MSA.from_encoded(*encode_rows(rows), ids, gap_character)
 
 
 def print_alignment(msa: MSA, cx_point: int = 100):
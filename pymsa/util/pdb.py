@@ -0,0 +1,118 @@
+import hashlib
+import logging
+import os
+import time
+
+LOGGER = logging.getLogger('pyMSA')
+
+DEFAULT_BASE_URL = 'https://files.rcsb.org/download/'
+DEFAULT_CACHE_DIRECTORY = os.path.join(os.path.expanduser('~'), '.cache', 'pymsa', 'pdb')
+
+# client errors worth retrying: request timeout and rate limiting
+RETRYABLE_STATUS_CODES = (408, 429)
+
+
+class PDBFetcher:
+    """
+    Download PDB files concurrently into a persistent, content-addressed cache: every file is stored under the
+    SHA-256 digest of its contents, and a reference file maps its URL to that digest. Files are only downloaded
+    once, and interrupted downloads never leave partial files behind.
+    """
+
+    def __init__(self, cache_directory: str = None, base_url: str = DEFAULT_BASE_URL,
+                 max_workers: int = 8, retries: int = 3, backoff: float = 0.5, timeout: float = 30):
+        """
+        :param cache_directory: Directory of the cache (by default, `$PYMSA_PDB_CACHE` or `DEFAULT_CACHE_DIRECTORY`).
+        """
+        if cache_directory is None:
+            cache_directory = os.environ.get('PYMSA_PDB_CACHE', DEFAULT_CACHE_DIRECTORY)
+
+        self.cache_directory = os.path.abspath(cache_directory)
+        self.base_url = base_url
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+
+    def fetch(self, pdb_id: str) -> str:
+        """
+        Return the path of a PDB file in the cache, downloading it if needed.
+
+        :param pdb_id: PDB identifier.
+        :return: Path of the file.
+        """
+        url = self.base_url + pdb_id + '.pdb'
+        reference_path = os.path.join(self.cache_directory, 'refs', hashlib.sha256(url.encode()).hexdigest())
+
+        if os.path.isfile(reference_path):
+            with open(reference_path, 'r') as reference:
+                path = self._get_object_path(reference.read().strip())
+
+            if os.path.isfile(path):
+                return path
+
+        LOGGER.debug('Downloading {}...'.format(url))
+        contents = self._download(url)
+        digest = hashlib.sha256(contents).hexdigest()
+        path = self._get_object_path(digest)
+
+        if not os.path.isfile(path):
+            self._write_atomically(path, contents)
+        self._write_atomically(reference_path, digest.encode())
+
+        return path
+
+    def fetch_all(self, pdb_ids: list) -> list:
+        """
+        Fetch several PDB files concurrently.
+
+        :param pdb_ids: PDB identifiers.
+        :return: Paths of the files, in the same order as the identifiers.
+        """
+        # imported here, as it is only needed by Strike
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            return list(executor.map(self.fetch, pdb_ids))
+
+    def _download(self, url: str) -> bytes:
+        # imported here, as it is slow to import and only needed by Strike
+        import urllib.request
+        from urllib.error import HTTPError, URLError
+
+        for attempt in range(self.retries + 1):
+            try:
+                with urllib.request.urlopen(url, timeout=self.timeout) as response:
+                    return response.read()
+            except HTTPError as error:
+                if error.code == 404:
+                    raise Exception('PDB not found in {}'.format(url))
+                if error.code < 500 and error.code not in RETRYABLE_STATUS_CODES:
+                    raise Exception('PDB couldn\'t be downloaded from {0}: {1}'.format(url, error))
+                reason = error
+            except (URLError, OSError) as error:
+                reason = error
+
+            if attempt < self.retries:
+                LOGGER.debug('Download of {0} failed ({1}), retrying...'.format(url, reason))
+                time.sleep(self.backoff * 2 ** attempt)
+
+        raise Exception('PDB couldn\'t be downloaded from {0}: {1}'.format(url, reason))
+
+    def _get_object_path(self, digest: str) -> str:
+        return os.path.join(self.cache_directory, 'objects', digest[:2], digest + '.pdb')
+
+    @staticmethod
+    def _write_atomically(path: str, contents: bytes) -> None:
+        import tempfile
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handle, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path))
+
+        try:
+            with os.fdopen(handle, 'wb') as file:
+                file.write(contents)
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
@@ -0,0 +1,26 @@
+from pymsa.core.msa import MSA, encode_rows
+
+
+def read_stockholm_file_as_msa(file_name: str, gap_character: str = '-') -> MSA:
+    """
+    Read the first alignment of a file in Stockholm format (e.g., from Pfam) as an encoded alignment. Markup lines
+    are skipped, and the '.' gaps are replaced with the gap character while the file is read.
+
+    :param file_name: Stockholm file.
+    :param gap_character: Gap character of the alignment.
+    :return: Alignment.
+    """
+    rows = {}
+    gaps = bytes.maketrans(b'.', gap_character.encode('ascii'))
+
+    with open(file_name, 'rb') as file:
+        for line in file:
+            if line.startswith(b'//'):
+                break
+            if line.startswith(b'#') or not line.strip():
+                continue
+
+            key, fragment = line.split()[:2]
+            rows.setdefault(key.decode(), bytearray()).extend(fragment.translate(gaps))
+
+    return MSA.from_encoded(*encode_rows(list(rows.values())), list(rows.keys()), gap_character)
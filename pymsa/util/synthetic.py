@@ -0,0 +1,32 @@
+import numpy as np
+
+from pymsa.core.msa import MSA
+
+PROTEIN = 'ARNDCQEGHILKMFPSTWYV'
+DNA = 'ACGT'
+
+
+def generate_alignment(number_of_sequences: int, length: int, gap_density: float = 0.1, alphabet: str = PROTEIN,
+                       seed: int = 0, gap_character: str = '-') -> MSA:
+    """
+    Generate a reproducible random alignment, e.g., for benchmarking. Residues are drawn uniformly from the alphabet
+    and every position is a gap with probability `gap_density`.
+
+    :param number_of_sequences: Number of sequences.
+    :param length: Length of the alignment.
+    :param gap_density: Probability of a position being a gap.
+    :param alphabet: Residues of the alignment.
+    :param seed: Seed of the random generator.
+    :param gap_character: Gap character of the alignment.
+    :return: Alignment.
+    """
+    generator = np.random.default_rng(seed)
+    characters = np.frombuffer((alphabet + gap_character).encode('ascii'), dtype=np.uint8)
+
+    residues = generator.integers(len(alphabet), size=(number_of_sequences, length))
+    residues[generator.random((number_of_sequences, length)) < gap_density] = len(alphabet)
+
+    raw = characters[residues]
+    sequences = [row.tobytes().decode('ascii') for row in raw]
+
+    return MSA(sequences, ['seq{}'.format(i) for i in range(number_of_sequences)], gap_character)
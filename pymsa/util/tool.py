@@ -1,5 +1,4 @@
 import os
-import subprocess
 from abc import abstractmethod, ABC
 from pathlib import Path
 
@@ -35,5 +34,7 @@ class StrikeEx(Tool):
         super(StrikeEx, self).__init__('strike', 'Single structure induced evaluation', exe_path)
 
     def run_command(self, command) -> float:
+        import subprocess
+
         bytess = subprocess.check_output(command, shell=True, env=os.environ.copy())
         return float("".join(map(chr, bytess)).split('\n')[-2])
@@ -25,7 +25,11 @@ setup(
         'Intended Audience :: Science/Research',
         'License :: OSI Approved :: MIT License',
         'Topic :: Scientific/Engineering :: Artificial Intelligence',
-        'Programming Language :: Python :: 3.6'
+        'Programming Language :: Python :: 3.8'
     ],
-    python_requires='>=3'
+    install_requires=['numpy>=1.17'],
+    entry_points={
+        'console_scripts': ['pymsa=pymsa.cli:main'],
+    },
+    python_requires='>=3.8'
 )
\ No newline at end of file